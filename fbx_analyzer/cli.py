@@ -86,11 +86,18 @@ def main(argv: Optional[Iterable[str]] = None) -> int:
             print("No skeletons found in file after checking animation data. Ensure the FBX includes rig nodes or skin clusters.")
             return 0
 
+        # Buffer the per-joint lines and emit them in one write; large rigs
+        # would otherwise pay a print syscall per joint.
+        lines = []
+        append = lines.append
         for idx, skeleton in enumerate(document.skeletons, start=1):
-            print(f"Skeleton {idx}: {skeleton.name} ({skeleton.joint_count} joints)")
+            append(f"Skeleton {idx}: {skeleton.name} ({skeleton.joint_count} joints)\n")
             for joint in skeleton.root.walk():
-                translation = ", ".join(f"{value:.3f}" for value in joint.transform.translation)
-                print(f"  - {joint.name} [{joint.joint_type}] (T: {translation})")
+                t = joint.transform.translation
+                append(
+                    f"  - {joint.name} [{joint.joint_type}] (T: {t[0]:.3f}, {t[1]:.3f}, {t[2]:.3f})\n"
+                )
+        sys.stdout.write("".join(lines))
         return 0
 
     launch_skeleton_viewer([document])
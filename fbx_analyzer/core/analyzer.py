@@ -7,7 +7,7 @@ from dataclasses import dataclass
 from typing import Any, Dict, Iterable, Optional, Protocol
 
 from .exceptions import FBXLoadError
-from . import sdk
+from . import sdk, traversal
 
 
 class SceneInspector(Protocol):
@@ -19,6 +19,26 @@ class SceneInspector(Protocol):
         """Return extracted information from the scene."""
 
 
+class FusedInspector(Protocol):
+    """Optional protocol for inspectors that share a single scene traversal.
+
+    Inspectors implementing it are fed every node exactly once by
+    :meth:`FBXAnalyzer.run` instead of re-walking the scene graph in their
+    own ``collect`` implementations.
+    """
+
+    id: str
+
+    def begin(self, context: "SceneContext") -> None:
+        """Prepare for a traversal of the scene rooted at ``context.root_node``."""
+
+    def visit(self, node: Any, attr: Any, attr_type: Any) -> None:
+        """Observe a single node along with its precomputed attribute data."""
+
+    def finalize(self) -> Any:
+        """Return the collected result once the traversal completes."""
+
+
 @dataclass
 class SceneContext:
     """Holds the FBX manager, scene, and convenience handles."""
@@ -27,6 +47,7 @@ class SceneContext:
     manager: Any
     scene: Any
     root_node: Any
+    node_stack: Optional[list] = None
 
 
 class FBXAnalyzer(contextlib.AbstractContextManager["FBXAnalyzer"]):
@@ -52,6 +73,7 @@ class FBXAnalyzer(contextlib.AbstractContextManager["FBXAnalyzer"]):
             manager=self._manager,
             scene=self._scene,
             root_node=root,
+            node_stack=[],
         )
 
     def load(self) -> "FBXAnalyzer":
@@ -84,10 +106,37 @@ class FBXAnalyzer(contextlib.AbstractContextManager["FBXAnalyzer"]):
         return self.load()
 
     def run(self, inspectors: Iterable[SceneInspector]) -> Dict[str, Any]:
-        """Execute inspectors and return their aggregated results."""
+        """Execute inspectors and return their aggregated results.
+
+        Inspectors implementing the :class:`FusedInspector` protocol share a
+        single depth-first walk of the scene so the graph is traversed once
+        instead of once per inspector. Everything else falls back to the
+        per-inspector ``collect`` path.
+        """
 
         results: Dict[str, Any] = {}
         ctx = self.context
+
+        fused = []
         for inspector in inspectors:
-            results[inspector.id] = inspector.collect(ctx)
+            if callable(getattr(inspector, "visit", None)) and callable(
+                getattr(inspector, "finalize", None)
+            ):
+                fused.append(inspector)
+            else:
+                results[inspector.id] = inspector.collect(ctx)
+
+        if fused:
+            for inspector in fused:
+                begin = getattr(inspector, "begin", None)
+                if callable(begin):
+                    begin(ctx)
+            for node in traversal.iter_nodes(ctx.root_node, stack=ctx.node_stack):
+                attr = node.GetNodeAttribute()
+                attr_type = attr.GetAttributeType() if attr else None
+                for inspector in fused:
+                    inspector.visit(node, attr, attr_type)
+            for inspector in fused:
+                results[inspector.id] = inspector.finalize()
+
         return results
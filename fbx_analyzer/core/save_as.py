@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import operator
 import os
 import shutil
-from dataclasses import dataclass, field
+from bisect import bisect_left
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -14,28 +17,90 @@ from . import sdk
 from .validation import SceneValidator, round_trip_check
 from .exceptions import FBXLoadError, FBXSaveError
 
+# C-level accessors used in diagnostics recording; methodcaller resolves the
+# SDK method once instead of paying a bound-method lookup per call.
+_GET_NAME = operator.methodcaller("GetName")
+_GET_UID = operator.methodcaller("GetUniqueID")
+
+_FBX_MODULE: Optional[Tuple[Any, Any]] = None
+
+
+def _get_fbx() -> Tuple[Any, Any]:
+    """Return the cached ``(fbx, FbxCommon)`` pair, importing it on first use."""
+
+    global _FBX_MODULE
+    if _FBX_MODULE is None:
+        _FBX_MODULE = sdk.import_fbx_module()
+    return _FBX_MODULE
+
+
+_SKELETON_LABELS: Dict[str, str] = {
+    "Root": "eRoot",
+    "Limb": "eLimb",
+    "LimbNode": "eLimbNode",
+    "Effector": "eEffector",
+}
+_SKELETON_TYPES_CACHE: Optional[Dict[str, Any]] = None
+
+
+def _get_skeleton_types() -> Dict[str, Any]:
+    """Return the label->enum mapping for skeleton types, resolved once."""
+
+    global _SKELETON_TYPES_CACHE
+    if _SKELETON_TYPES_CACHE is None:
+        fbx, _ = _get_fbx()
+        skeleton_types: Dict[str, Any] = {}
+        for label, enum_name in _SKELETON_LABELS.items():
+            # Direct getattr covers every known binding layout; the dir()-
+            # scanning resolve_enum_value fallback only runs when it misses
+            # (e.g. values nested under FbxSkeleton.EType).
+            value = getattr(fbx.FbxSkeleton, enum_name, None)
+            if value is None:
+                try:
+                    value = resolve_enum_value(fbx.FbxSkeleton, enum_name)
+                except AttributeError:
+                    continue
+            skeleton_types[label] = value
+        _SKELETON_TYPES_CACHE = skeleton_types
+    return _SKELETON_TYPES_CACHE
+
 
 @dataclass
 class SceneExportDiagnostics:
+    """Collects details about an export.
+
+    The list and dict fields are lazily initialized (``None`` until first
+    written) so the copy fast-path of :func:`save_scene_graph_as` does not pay
+    a dozen small allocations per call. Use :meth:`to_dict` to serialize; it
+    coalesces untouched fields to empty containers.
+    """
+
     mode: str = "rebuild"
     reused_root_uid: Optional[int] = None
     source_child_count: int = 0
-    created_nodes: List[Dict[str, Any]] = field(default_factory=list)
-    reparented_nodes: List[Dict[str, Any]] = field(default_factory=list)
-    removed_orphans: List[Dict[str, Any]] = field(default_factory=list)
-    pruned_nodes: List[Dict[str, Any]] = field(default_factory=list)
-    attribute_updates: List[Dict[str, Any]] = field(default_factory=list)
-    transform_updates: List[Dict[str, Any]] = field(default_factory=list)
-    validation_report_before: Dict[str, Any] = field(default_factory=dict)
-    validation_report_after: Dict[str, Any] = field(default_factory=dict)
-    auto_repairs: List[Dict[str, str]] = field(default_factory=list)
-    roundtrip_report: Dict[str, Any] = field(default_factory=dict)
+    created_nodes: Optional[List[Dict[str, Any]]] = None
+    reparented_nodes: Optional[List[Dict[str, Any]]] = None
+    removed_orphans: Optional[List[Dict[str, Any]]] = None
+    pruned_nodes: Optional[List[Dict[str, Any]]] = None
+    attribute_updates: Optional[List[Dict[str, Any]]] = None
+    transform_updates: Optional[List[Dict[str, Any]]] = None
+    validation_report_before: Optional[Dict[str, Any]] = None
+    validation_report_after: Optional[Dict[str, Any]] = None
+    auto_repairs: Optional[List[Dict[str, str]]] = None
+    roundtrip_report: Optional[Dict[str, Any]] = None
+
+    def _ensure_list(self, name: str) -> List[Any]:
+        value = getattr(self, name)
+        if value is None:
+            value = []
+            setattr(self, name, value)
+        return value
 
     def record_root_reuse(self, node) -> None:
         self.reused_root_uid = int(node.GetUniqueID())
 
     def record_creation(self, node, parent) -> None:
-        self.created_nodes.append(
+        self._ensure_list("created_nodes").append(
             {
                 "node": self._node_summary(node),
                 "parent": self._node_summary(parent) if parent is not None else None,
@@ -43,7 +108,7 @@ class SceneExportDiagnostics:
         )
 
     def record_reparent(self, node, previous_parent, new_parent) -> None:
-        self.reparented_nodes.append(
+        self._ensure_list("reparented_nodes").append(
             {
                 "node": self._node_summary(node),
                 "previous_parent": self._node_summary(previous_parent)
@@ -54,7 +119,7 @@ class SceneExportDiagnostics:
         )
 
     def record_orphan_removal(self, node, parent) -> None:
-        self.removed_orphans.append(
+        self._ensure_list("removed_orphans").append(
             {
                 "node": self._node_summary(node),
                 "parent": self._node_summary(parent) if parent is not None else None,
@@ -62,10 +127,10 @@ class SceneExportDiagnostics:
         )
 
     def record_pruned(self, node) -> None:
-        self.pruned_nodes.append(self._node_summary(node))
+        self._ensure_list("pruned_nodes").append(self._node_summary(node))
 
     def record_attribute(self, node, attr_type: str, attr_class: str) -> None:
-        self.attribute_updates.append(
+        self._ensure_list("attribute_updates").append(
             {
                 "node": self._node_summary(node),
                 "attribute_type": attr_type,
@@ -74,7 +139,7 @@ class SceneExportDiagnostics:
         )
 
     def record_transform(self, node, model: "SceneNode") -> None:
-        self.transform_updates.append(
+        self._ensure_list("transform_updates").append(
             {
                 "node": self._node_summary(node),
                 "translation": tuple(float(value) for value in model.translation),
@@ -83,11 +148,28 @@ class SceneExportDiagnostics:
             }
         )
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "mode": self.mode,
+            "reused_root_uid": self.reused_root_uid,
+            "source_child_count": self.source_child_count,
+            "created_nodes": self.created_nodes or [],
+            "reparented_nodes": self.reparented_nodes or [],
+            "removed_orphans": self.removed_orphans or [],
+            "pruned_nodes": self.pruned_nodes or [],
+            "attribute_updates": self.attribute_updates or [],
+            "transform_updates": self.transform_updates or [],
+            "validation_report_before": self.validation_report_before or {},
+            "validation_report_after": self.validation_report_after or {},
+            "auto_repairs": self.auto_repairs or [],
+            "roundtrip_report": self.roundtrip_report or {},
+        }
+
     @staticmethod
     def _node_summary(node) -> Dict[str, Any]:
         return {
-            "name": node.GetName() or "",
-            "uid": int(node.GetUniqueID()),
+            "name": _GET_NAME(node) or "",
+            "uid": int(_GET_UID(node)),
         }
 
 def save_scene_graph_as(
@@ -96,6 +178,7 @@ def save_scene_graph_as(
     scene_graph: Optional[SceneNode],
     diagnostics: Optional[SceneExportDiagnostics] = None,
     force_rebuild: bool = False,
+    verify_roundtrip: bool = True,
 ) -> Optional[SceneExportDiagnostics]:
     """Persist edits in ``scene_graph`` into a copy of ``source_path``.
 
@@ -104,14 +187,18 @@ def save_scene_graph_as(
     ``diagnostics``) to always round-trip the scene through the FBX SDK exporter,
     which is useful when debugging export discrepancies.
 
+    ``verify_roundtrip`` controls whether the exported file is reloaded and
+    re-validated after saving. That doubles the I/O and parse cost of a save,
+    so callers exporting trusted edits may pass ``False`` to skip it.
+
     Returns the ``SceneExportDiagnostics`` instance that was provided (or a new
     one if none was given)."""
 
     destination = str(target_path)
-    if os.path.abspath(source_path) == os.path.abspath(destination):
+    if _is_same_file(source_path, destination):
         raise FBXSaveError("The destination path must be different from the source path.")
 
-    Path(destination).parent.mkdir(parents=True, exist_ok=True)
+    _ensure_parent_dir(destination)
 
     diagnostics = diagnostics or SceneExportDiagnostics()
 
@@ -120,9 +207,9 @@ def save_scene_graph_as(
         _copy_scene_file(source_path, destination)
         return diagnostics
 
-    manager = sdk.create_manager()
+    manager = sdk.acquire_manager()
+    scene = None
     try:
-        sdk.create_io_settings(manager)
         scene = sdk.create_scene(manager)
         if not sdk.load_scene(manager, scene, source_path):
             raise FBXLoadError(f"Failed to load FBX scene from '{source_path}'")
@@ -162,36 +249,77 @@ def save_scene_graph_as(
         if not sdk.save_scene(manager, scene, destination):
             raise FBXSaveError(f"Failed to export FBX scene to '{destination}'")
 
-        try:
-            roundtrip = round_trip_check(
-                destination,
-                canonical_settings=validator.canonical,
-                baseline_metrics=baseline_metrics,
-            )
-        except RuntimeError as exc:
-            raise FBXSaveError(str(exc)) from exc
-        diagnostics.roundtrip_report = roundtrip.to_dict()
-        if not roundtrip.validation.export_ready or roundtrip.metrics_diff:
-            summary = ", ".join(
-                f"{name}: {status}" for name, status in roundtrip.validation.status_summary().items()
-            )
-            diff_summary = "; ".join(
-                f"{entry['metric']} (expected {entry['expected']}, actual {entry['actual']})"
-                for entry in roundtrip.metrics_diff
-            )
-            details = summary
-            if diff_summary:
-                details = f"{details}; metrics diff -> {diff_summary}" if details else diff_summary
-            raise FBXSaveError(
-                "Round-trip validation failed for exported scene: "
-                f"{details or 'validation returned failures.'}"
-            )
+        if verify_roundtrip:
+            try:
+                roundtrip = round_trip_check(
+                    destination,
+                    canonical_settings=validator.canonical,
+                    baseline_metrics=baseline_metrics,
+                )
+            except RuntimeError as exc:
+                raise FBXSaveError(str(exc)) from exc
+            diagnostics.roundtrip_report = roundtrip.to_dict()
+            if not roundtrip.validation.export_ready or roundtrip.metrics_diff:
+                summary = ", ".join(
+                    f"{name}: {status}"
+                    for name, status in roundtrip.validation.status_summary().items()
+                )
+                diff_summary = "; ".join(
+                    f"{entry['metric']} (expected {entry['expected']}, actual {entry['actual']})"
+                    for entry in roundtrip.metrics_diff
+                )
+                details = summary
+                if diff_summary:
+                    details = f"{details}; metrics diff -> {diff_summary}" if details else diff_summary
+                raise FBXSaveError(
+                    "Round-trip validation failed for exported scene: "
+                    f"{details or 'validation returned failures.'}"
+                )
     finally:
-        sdk.destroy_manager(manager)
+        if scene is not None:
+            scene.Destroy()
+        sdk.release_manager(manager)
 
     return diagnostics
 
 
+_SAVE_EXECUTOR: Optional[ThreadPoolExecutor] = None
+
+
+def _get_save_executor() -> ThreadPoolExecutor:
+    global _SAVE_EXECUTOR
+    if _SAVE_EXECUTOR is None:
+        _SAVE_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="fbx-save")
+    return _SAVE_EXECUTOR
+
+
+def save_scene_graph_as_async(
+    source_path: str,
+    target_path: str,
+    scene_graph: Optional[SceneNode],
+    diagnostics: Optional[SceneExportDiagnostics] = None,
+    force_rebuild: bool = False,
+    verify_roundtrip: bool = True,
+) -> "Future[Optional[SceneExportDiagnostics]]":
+    """Run :func:`save_scene_graph_as` on a background thread.
+
+    Saves are serialized through a single worker so pooled manager usage
+    stays single-threaded; callers chain ``Future.add_done_callback`` or
+    block on ``result()`` when completion matters. The save itself is no
+    faster — this only keeps the calling thread (e.g. a UI loop) responsive.
+    """
+
+    return _get_save_executor().submit(
+        save_scene_graph_as,
+        source_path,
+        target_path,
+        scene_graph,
+        diagnostics=diagnostics,
+        force_rebuild=force_rebuild,
+        verify_roundtrip=verify_roundtrip,
+    )
+
+
 def rebuild_scene_graph_as(
     source_path: str,
     target_path: str,
@@ -219,15 +347,96 @@ def rebuild_scene_graph_as(
     return result
 
 
+def _is_same_file(source_path: str, destination: str) -> bool:
+    """Detect whether source and destination refer to the same file.
+
+    Prefers ``os.path.samefile`` (a device/inode compare that also catches
+    symlinks and hardlinks) and falls back to a normalized-path comparison
+    when either path does not exist yet.
+    """
+
+    try:
+        if os.path.exists(source_path) and os.path.exists(destination):
+            if os.path.samefile(source_path, destination):
+                return True
+    except OSError:
+        pass
+    return os.path.normcase(os.path.abspath(source_path)) == os.path.normcase(
+        os.path.abspath(destination)
+    )
+
+
+_ENSURED_DIRS: set = set()
+
+
+def _ensure_parent_dir(destination: str) -> None:
+    """Create ``destination``'s parent directory once per process.
+
+    Batch exports typically target one output folder; memoizing the already
+    created directories skips the stat/mkdir syscall pair on repeat saves.
+    """
+
+    parent = str(Path(destination).parent)
+    if parent not in _ENSURED_DIRS:
+        Path(parent).mkdir(parents=True, exist_ok=True)
+        _ENSURED_DIRS.add(parent)
+
+
 def _copy_scene_file(source_path: str, destination: str) -> None:
-    """Copy the source scene verbatim when no edits were requested."""
+    """Copy the source scene verbatim when no edits were requested.
+
+    Prefers in-kernel byte moves (``os.copy_file_range``, then
+    ``os.sendfile``) so large FBX files skip the userspace round trip of a
+    chunked read/write loop, falling back to a buffered copy where the OS
+    does not support them. Metadata is preserved as ``shutil.copy2`` did.
+    """
 
     try:
-        shutil.copy2(source_path, destination)
+        with open(source_path, "rb") as src, open(destination, "wb") as dst:
+            _copy_file_contents(src, dst)
+        shutil.copystat(source_path, destination)
     except OSError as exc:  # pragma: no cover - depends on filesystem
         raise FBXSaveError(f"Failed to copy FBX file to '{destination}'") from exc
 
 
+def _copy_file_contents(src, dst) -> None:
+    """Move all bytes from ``src`` to ``dst`` (both open binary files)."""
+
+    size = os.fstat(src.fileno()).st_size
+    if not size:
+        return
+
+    offset = 0
+    try:
+        if hasattr(os, "copy_file_range"):
+            while offset < size:
+                moved = os.copy_file_range(
+                    src.fileno(), dst.fileno(), size - offset, offset, offset
+                )
+                if moved == 0:
+                    break
+                offset += moved
+        elif hasattr(os, "sendfile"):
+            while offset < size:
+                sent = os.sendfile(dst.fileno(), src.fileno(), offset, size - offset)
+                if sent == 0:
+                    break
+                offset += sent
+    except OSError:
+        # Kernel-side copies can be refused (cross-device, unsupported
+        # filesystem); only fall back if nothing was written yet.
+        if offset:
+            raise
+
+    if offset < size:
+        # copy_file_range with explicit offsets never advances the
+        # destination's file position, so seek both sides before streaming
+        # the remainder or the fallback would overwrite the copied prefix.
+        src.seek(offset)
+        dst.seek(offset)
+        shutil.copyfileobj(src, dst, length=1024 * 1024)
+
+
 def _apply_scene_graph_changes(
     scene,
     scene_graph: SceneNode,
@@ -236,12 +445,32 @@ def _apply_scene_graph_changes(
     """Reconcile the editable ``SceneNode`` tree back onto the FBX scene."""
 
     scene_root = scene.GetRootNode()
-    existing_nodes, existing_paths = _map_scene_nodes(scene_root)
+
+    if (
+        scene_graph.loaded_signature is not None
+        and scene_graph.structure_signature() == scene_graph.loaded_signature
+        and _apply_transforms_only(scene_root, scene_graph, diagnostics)
+    ):
+        # Structure and attribute types match the loaded scene, so only the
+        # (possibly edited) transforms needed applying.
+        return
+
+    existing_nodes, existing_paths, parent_mapping = _map_scene_nodes(scene_root)
     used_uids: set[int] = set()
     root_uid = scene_root.GetUniqueID()
 
-    def sync(node_model: SceneNode, parent_fbx) -> Any:  # type: ignore[valid-type]
-        fbx, _ = sdk.import_fbx_module()
+    fbx, _ = _get_fbx()
+    fbx_node_create = fbx.FbxNode.Create
+
+    # Iterative depth-first sync: recursion per node risks Python's recursion
+    # limit on deep rigs and pays a call frame per joint. Each stack entry
+    # carries the parent's desired-child UID list so orphan removal can run
+    # once the whole subtree has been resolved.
+    visited: List[Tuple[Any, List[int]]] = []
+    root_slot: List[int] = []
+    stack: List[Tuple[SceneNode, Any, List[int]]] = [(scene_graph, scene_root, root_slot)]
+    while stack:
+        node_model, parent_fbx, parent_slot = stack.pop()
 
         fbx_node = existing_nodes.get(node_model.uid) if node_model.uid is not None else None
 
@@ -257,7 +486,7 @@ def _apply_scene_graph_changes(
 
         if fbx_node is None:
             name = node_model.name or "Node"
-            fbx_node = fbx.FbxNode.Create(scene, name)
+            fbx_node = fbx_node_create(scene, name)
             parent_fbx.AddChild(fbx_node)
             node_model.uid = fbx_node.GetUniqueID()
             existing_nodes[node_model.uid] = fbx_node
@@ -273,7 +502,10 @@ def _apply_scene_graph_changes(
         if node_model.original_path not in existing_paths:
             existing_paths[node_model.original_path] = fbx_node
 
-        used_uids.add(fbx_node.GetUniqueID())
+        # Every branch above leaves node_model.uid equal to the FBX node's
+        # UID, so the desired-child bookkeeping needs no further SDK calls.
+        parent_slot.append(node_model.uid)
+        used_uids.add(node_model.uid)
 
         _apply_node_attribute(
             scene,
@@ -284,30 +516,72 @@ def _apply_scene_graph_changes(
         )
         _apply_node_transform(fbx_node, node_model, diagnostics)
 
-        desired_children = [sync(child_model, fbx_node) for child_model in node_model.children]
-        _remove_orphaned_children(fbx_node, desired_children, diagnostics)
+        desired_uids: List[int] = []
+        visited.append((fbx_node, desired_uids))
+        for child_model in reversed(node_model.children):
+            stack.append((child_model, fbx_node, desired_uids))
 
-        return fbx_node
+    for fbx_node, desired_uids in visited:
+        _remove_orphaned_children(fbx_node, desired_uids, diagnostics, parent_mapping)
 
-    sync(scene_graph, scene_root)
+    _prune_unused_nodes(scene_root, existing_nodes, used_uids, parent_mapping, diagnostics)
 
-    _prune_unused_nodes(scene_root, existing_nodes, used_uids, diagnostics)
 
+def _apply_transforms_only(
+    scene_root,
+    scene_graph: SceneNode,
+    diagnostics: Optional[SceneExportDiagnostics] = None,
+) -> bool:  # type: ignore[valid-type]
+    """Apply transforms for a structurally unchanged model tree.
 
-def _map_scene_nodes(root) -> Tuple[Dict[int, Any], Dict[Tuple[int, ...], Any]]:  # type: ignore[valid-type]
-    """Create UID and path lookups for every node in the current scene."""
+    Returns ``False`` when a model node cannot be matched by UID (the caller
+    then falls back to the full sync; transform application is idempotent so
+    partial progress is harmless).
+    """
+
+    uid_mapping, _, _ = _map_scene_nodes(scene_root)
+    get_node = uid_mapping.get
+    stack = [scene_graph]
+    pop = stack.pop
+    while stack:
+        model = pop()
+        fbx_node = get_node(model.uid) if model.uid is not None else None
+        if fbx_node is None:
+            return False
+        _apply_node_transform(fbx_node, model, diagnostics)
+        stack.extend(model.children)
+    return True
+
+
+def _map_scene_nodes(
+    root,
+) -> Tuple[Dict[int, Any], Dict[Tuple[int, ...], Any], Dict[int, Any]]:  # type: ignore[valid-type]
+    """Create UID, path, and parent lookups for every node in the current scene.
+
+    The parent mapping (UID -> parent node, ``None`` for the root) is filled
+    during the same walk so later passes do not need per-node ``GetParent``
+    calls into the SDK.
+    """
 
     uid_mapping: Dict[int, Any] = {}
     path_mapping: Dict[Tuple[int, ...], Any] = {}
-
-    def walk(node, path: Tuple[int, ...]) -> None:  # type: ignore[valid-type]
-        uid_mapping[node.GetUniqueID()] = node
+    parent_mapping: Dict[int, Any] = {}
+
+    stack: List[Tuple[Any, Tuple[int, ...], Any]] = [(root, (), None)]
+    pop = stack.pop
+    push = stack.extend
+    while stack:
+        node, path, parent = pop()
+        uid = node.GetUniqueID()
+        uid_mapping[uid] = node
         path_mapping[path] = node
-        for idx in range(node.GetChildCount()):
-            walk(node.GetChild(idx), path + (idx,))
+        parent_mapping[uid] = parent
+        count = node.GetChildCount()
+        if count:
+            get_child = node.GetChild
+            push([(get_child(idx), path + (idx,), node) for idx in range(count)])
 
-    walk(root, ())
-    return uid_mapping, path_mapping
+    return uid_mapping, path_mapping, parent_mapping
 
 
 def _ensure_parent(parent_fbx, child):  # type: ignore[valid-type]
@@ -328,15 +602,41 @@ def _ensure_parent(parent_fbx, child):  # type: ignore[valid-type]
 
 
 def _remove_orphaned_children(
-    parent, desired_children, diagnostics: Optional[SceneExportDiagnostics] = None
+    parent,
+    desired_uids,
+    diagnostics: Optional[SceneExportDiagnostics] = None,
+    parent_mapping: Optional[Dict[int, Any]] = None,
 ):  # type: ignore[valid-type]
-    """Remove FBX children that are no longer represented in the model tree."""
+    """Remove FBX children whose UID is not in ``desired_uids``.
 
-    desired_ids = {child.GetUniqueID() for child in desired_children}
-    for idx in reversed(range(parent.GetChildCount())):
-        child = parent.GetChild(idx)
-        if child.GetUniqueID() not in desired_ids:
-            parent.RemoveChild(child)
+    The sync pass hands over plain UID lists, so building the probe structure
+    costs no SDK calls.
+    """
+
+    if len(desired_uids) <= 64:
+        # Small desired sets are the common case; a sorted list probed with
+        # bisect beats paying hash-and-resize costs for a throwaway set.
+        desired_sorted = sorted(desired_uids)
+        size = len(desired_sorted)
+
+        def in_desired(uid, arr=desired_sorted, size=size):
+            pos = bisect_left(arr, uid)
+            return pos < size and arr[pos] == uid
+
+    else:
+        in_desired = frozenset(desired_uids).__contains__
+
+    # Snapshot the children once; iterating in reverse over the snapshot
+    # keeps removals index-safe without re-fetching GetChild per index.
+    get_child = parent.GetChild
+    children = [get_child(idx) for idx in range(parent.GetChildCount())]
+    remove_child = parent.RemoveChild
+    for child in reversed(children):
+        uid = child.GetUniqueID()
+        if not in_desired(uid):
+            remove_child(child)
+            if parent_mapping is not None:
+                parent_mapping[uid] = None
             if diagnostics is not None:
                 diagnostics.record_orphan_removal(child, parent)
 
@@ -345,48 +645,88 @@ def _prune_unused_nodes(
     scene_root,
     existing_nodes: Dict[int, Any],
     used_uids: set[int],
+    parent_mapping: Dict[int, Any],
     diagnostics: Optional[SceneExportDiagnostics] = None,
 ) -> None:  # type: ignore[valid-type]
-    """Delete nodes that were removed from the editable scene graph."""
+    """Delete nodes that were removed from the editable scene graph.
 
-    root_uid = scene_root.GetUniqueID()
-    for uid, node in list(existing_nodes.items()):
-        if uid == root_uid or uid in used_uids:
-            continue
-        parent = node.GetParent()
-        if parent is None:
-            continue
-        children = [node.GetChild(i) for i in range(node.GetChildCount())]
+    ``parent_mapping`` comes from :func:`_map_scene_nodes` (kept current by
+    the sync passes) and replaces per-node ``GetParent`` calls into the SDK.
+    """
+
+    get_parent = parent_mapping.get
+    # Let set arithmetic in C find the unused UIDs instead of filtering every
+    # existing node through Python-level membership checks.
+    candidates = existing_nodes.keys() - used_uids
+    candidates.discard(scene_root.GetUniqueID())
+    pruned = {
+        uid: existing_nodes[uid] for uid in candidates if get_parent(uid) is not None
+    }
+    if not pruned:
+        return
+
+    # Resolve each orphan's nearest surviving ancestor before mutating the
+    # tree, so children of pruned chains are reparented once to their final
+    # home instead of being shuffled up one level per pruned ancestor.
+    survivors: Dict[int, Any] = {}
+
+    def surviving_ancestor(uid: int) -> Any:
+        chain = []
+        current = get_parent(uid)
+        while current is not None:
+            current_uid = current.GetUniqueID()
+            if current_uid not in pruned:
+                break
+            if current_uid in survivors:
+                current = survivors[current_uid]
+                break
+            chain.append(current_uid)
+            current = get_parent(current_uid)
+        for ancestor_uid in chain:
+            survivors[ancestor_uid] = current
+        return current
+
+    rescue_targets = {uid: surviving_ancestor(uid) for uid in pruned}
+
+    for uid, node in pruned.items():
+        target = rescue_targets[uid]
+        get_child = node.GetChild
+        remove_child = node.RemoveChild
+        add_child = target.AddChild if target is not None else None
+        children = [get_child(i) for i in range(node.GetChildCount())]
         for child in children:
-            node.RemoveChild(child)
-            parent.AddChild(child)
+            remove_child(child)
+            if add_child is not None:
+                add_child(child)
+            parent_mapping[child.GetUniqueID()] = target
             if diagnostics is not None:
-                diagnostics.record_reparent(child, node, parent)
+                diagnostics.record_reparent(child, node, target)
         if diagnostics is not None:
             diagnostics.record_pruned(node)
-        parent.RemoveChild(node)
+        parent = get_parent(uid)
+        if parent is not None:
+            parent.RemoveChild(node)
 
 
 def _apply_node_attribute(
     scene, node, attr_type: str, attr_class: str, diagnostics: Optional[SceneExportDiagnostics] = None
 ) -> None:  # type: ignore[valid-type]
-    fbx, _ = sdk.import_fbx_module()
-    skeleton_labels = {"Root": "eRoot", "Limb": "eLimb", "LimbNode": "eLimbNode", "Effector": "eEffector"}
-    skeleton_types = {}
-    for label, enum_name in skeleton_labels.items():
-        try:
-            skeleton_types[label] = resolve_enum_value(fbx.FbxSkeleton, enum_name)
-        except AttributeError:
-            continue
+    fbx, _ = _get_fbx()
+    skeleton_types = _get_skeleton_types()
 
     node_attribute = node.GetNodeAttribute()
 
     if attr_type in skeleton_types and skeleton_types[attr_type] is not None:
-        if not isinstance(node_attribute, fbx.FbxSkeleton):
+        desired_type = skeleton_types[attr_type]
+        if isinstance(node_attribute, fbx.FbxSkeleton):
+            # No-op rebuilds hit this for every joint; a single type compare
+            # avoids re-creating or re-setting an already correct attribute.
+            if node_attribute.GetSkeletonType() != desired_type:
+                node_attribute.SetSkeletonType(desired_type)
+        else:
             skeleton = fbx.FbxSkeleton.Create(scene, node.GetName() or "Skeleton")
+            skeleton.SetSkeletonType(desired_type)
             node.SetNodeAttribute(skeleton)
-            node_attribute = skeleton
-        node_attribute.SetSkeletonType(skeleton_types[attr_type])
     else:
         if isinstance(node_attribute, fbx.FbxSkeleton) and attr_type == "Node":
             node.SetNodeAttribute(None)
@@ -395,18 +735,32 @@ def _apply_node_attribute(
         diagnostics.record_attribute(node, attr_type, attr_class)
 
 
+_TRANSFORM_EPSILON = 1e-9
+
+
+def _vector_matches(current, desired) -> bool:
+    """Check whether an FBX vector already equals the model's values."""
+
+    for current_value, desired_value in zip(current, desired):
+        if abs(float(current_value) - float(desired_value)) > _TRANSFORM_EPSILON:
+            return False
+    return True
+
+
 def _apply_node_transform(
     node, model: SceneNode, diagnostics: Optional[SceneExportDiagnostics] = None
 ) -> None:  # type: ignore[valid-type]
-    fbx, _ = sdk.import_fbx_module()
-
-    translation = fbx.FbxDouble3(*model.translation)
-    rotation = fbx.FbxDouble3(*model.rotation)
-    scaling = fbx.FbxDouble3(*model.scaling)
-
-    node.LclTranslation.Set(translation)
-    node.LclRotation.Set(rotation)
-    node.LclScaling.Set(scaling)
+    fbx, _ = _get_fbx()
+
+    # Skip the SDK setters (and the FbxDouble3 allocations feeding them) for
+    # components that already match the model, the common case when saving a
+    # scene where only a handful of nodes were edited.
+    if not _vector_matches(node.LclTranslation.Get(), model.translation):
+        node.LclTranslation.Set(fbx.FbxDouble3(*model.translation))
+    if not _vector_matches(node.LclRotation.Get(), model.rotation):
+        node.LclRotation.Set(fbx.FbxDouble3(*model.rotation))
+    if not _vector_matches(node.LclScaling.Get(), model.scaling):
+        node.LclScaling.Set(fbx.FbxDouble3(*model.scaling))
 
     if diagnostics is not None:
         diagnostics.record_transform(node, model)
@@ -2,18 +2,28 @@
 
 from __future__ import annotations
 
-from typing import Optional
+import atexit
+import queue
+from typing import Optional, Tuple
 
 from .exceptions import FBXSDKNotAvailableError
 
+_cached_modules: Optional[Tuple] = None
+
 
 def import_fbx_module():
     """Import the Autodesk FBX SDK Python module.
 
     Encapsulates the import so code can provide a helpful error when it is
-    missing instead of failing at module import time.
+    missing instead of failing at module import time. The resolved modules
+    are memoized; helpers below call this per invocation, so repeat calls
+    must not pay the import machinery again.
     """
 
+    global _cached_modules
+    if _cached_modules is not None:
+        return _cached_modules
+
     try:
         import fbx  # type: ignore
         import FbxCommon  # type: ignore
@@ -23,7 +33,8 @@ def import_fbx_module():
             "Install the SDK and ensure the 'fbx' and 'FbxCommon' modules are on PYTHONPATH."
         ) from exc
 
-    return fbx, FbxCommon
+    _cached_modules = (fbx, FbxCommon)
+    return _cached_modules
 
 
 def create_manager():
@@ -71,14 +82,80 @@ def destroy_manager(manager):
     manager.Destroy()
 
 
+_manager_pool: "queue.LifoQueue" = queue.LifoQueue()
+
+
+def acquire_manager():
+    """Borrow a manager from the process-wide pool, creating one if empty.
+
+    Manager creation registers plugins and IO settings, a fixed cost worth
+    amortizing across batch exports. Borrowed managers come with IO settings
+    already attached; return them with :func:`release_manager` rather than
+    :func:`destroy_manager`.
+    """
+
+    try:
+        return _manager_pool.get_nowait()
+    except queue.Empty:
+        manager = create_manager()
+        create_io_settings(manager)
+        return manager
+
+
+def release_manager(manager) -> None:
+    """Return a borrowed manager to the pool for reuse.
+
+    Callers must destroy any scenes they created with the manager first;
+    the pool only recycles the manager itself.
+    """
+
+    _manager_pool.put(manager)
+
+
+@atexit.register
+def _drain_manager_pool() -> None:  # pragma: no cover - interpreter shutdown
+    while True:
+        try:
+            _manager_pool.get_nowait().Destroy()
+        except queue.Empty:
+            break
+
+
+_writer_format: Optional[int] = None
+
+
+def _resolve_writer_format(manager) -> int:
+    """Pick the binary FBX writer, falling back to the native format.
+
+    The native writer is ASCII in some SDK configurations; binary output is
+    both smaller and faster to write. The registry is per-SDK, so the chosen
+    index is cached for the process.
+    """
+
+    global _writer_format
+    if _writer_format is None:
+        registry = manager.GetIOPluginRegistry()
+        file_format = registry.GetNativeWriterFormat()
+        try:
+            for index in range(registry.GetWriterFormatCount()):
+                description = registry.GetWriterFormatDescription(index) or ""
+                lowered = description.lower()
+                if "fbx" in lowered and "binary" in lowered:
+                    file_format = index
+                    break
+        except AttributeError:  # pragma: no cover - registry API varies by SDK
+            pass
+        _writer_format = file_format
+    return _writer_format
+
+
 def save_scene(manager, scene, path: str) -> bool:
     """Save the provided FBX scene to ``path``."""
 
     fbx, _ = import_fbx_module()
     exporter = fbx.FbxExporter.Create(manager, "")
     try:
-        registry = manager.GetIOPluginRegistry()
-        file_format = registry.GetNativeWriterFormat()
+        file_format = _resolve_writer_format(manager)
         if not exporter.Initialize(path, file_format, manager.GetIOSettings()):
             return False
         if not exporter.Export(scene):
@@ -2,18 +2,30 @@
 
 from __future__ import annotations
 
-from typing import Iterable, Iterator
+from typing import Dict, Iterable, Iterator, List, Optional
 
 
-def iter_nodes(root) -> Iterator:
-    """Yield nodes depth-first starting at `root` (inclusive)."""
+def iter_nodes(root, stack: Optional[List] = None) -> Iterator:
+    """Yield nodes depth-first starting at `root` (inclusive).
 
-    stack = [root]
+    Callers that traverse repeatedly can pass a reusable ``stack`` list to
+    avoid reallocating (and regrowing) the work stack on every walk.
+    """
+
+    if stack is None:
+        stack = [root]
+    else:
+        stack.clear()
+        stack.append(root)
+    pop = stack.pop
+    push = stack.extend
     while stack:
-        node = stack.pop()
+        node = pop()
         yield node
-        for idx in range(node.GetChildCount() - 1, -1, -1):
-            stack.append(node.GetChild(idx))
+        count = node.GetChildCount()
+        if count:
+            get_child = node.GetChild
+            push([get_child(idx) for idx in range(count - 1, -1, -1)])
 
 
 def iter_by_attribute_type(root, attribute_type) -> Iterator:
@@ -23,3 +35,19 @@ def iter_by_attribute_type(root, attribute_type) -> Iterator:
         attr = node.GetNodeAttribute()
         if attr and attr.GetAttributeType() == attribute_type:
             yield node
+
+
+def group_by_attribute_type(root) -> Dict:
+    """Bucket every node under `root` by its primary attribute type.
+
+    Attribute-less nodes are grouped under ``None``. Callers that need nodes
+    of several types can build this once and index into it instead of walking
+    the tree once per type with :func:`iter_by_attribute_type`.
+    """
+
+    groups: Dict = {}
+    for node in iter_nodes(root):
+        attr = node.GetNodeAttribute()
+        attr_type = attr.GetAttributeType() if attr else None
+        groups.setdefault(attr_type, []).append(node)
+    return groups
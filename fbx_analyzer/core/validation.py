@@ -2,19 +2,20 @@
 
 from __future__ import annotations
 
+import functools
 import math
-from dataclasses import dataclass, field
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
+from typing import Any, Callable, ClassVar, Dict, Iterable, List, Optional, Sequence, Tuple
 
 from . import sdk
+from .traversal import iter_nodes
 
 
 Severity = str
 
 
-def _severity_order(value: Severity) -> int:
-    order = {"PASS": 0, "WARN": 1, "FAIL": 2}
-    return order.get(value, 2)
+_SEVERITY_RANK: Dict[Severity, int] = {"PASS": 0, "WARN": 1, "FAIL": 2}
 
 
 @dataclass
@@ -27,6 +28,17 @@ class ValidationIssue:
     object_path: Optional[str] = None
     fix_applied: Optional[str] = None
 
+    def to_dict(self) -> Dict[str, Any]:
+        # Explicit literal rather than a __dict__ copy: reports can carry
+        # thousands of issues and serialization is allocation-bound.
+        return {
+            "severity": self.severity,
+            "message": self.message,
+            "code": self.code,
+            "object_path": self.object_path,
+            "fix_applied": self.fix_applied,
+        }
+
 
 @dataclass
 class ValidationCategoryReport:
@@ -34,6 +46,20 @@ class ValidationCategoryReport:
 
     name: str
     issues: List[ValidationIssue] = field(default_factory=list)
+    # Status is maintained incrementally by add_issue; recomputing the max
+    # severity per access made status_summary/export_ready O(issues) each.
+    _status_rank: int = field(default=0, init=False, repr=False)
+    _status: Severity = field(default="PASS", init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        for issue in self.issues:
+            self._observe(issue.severity)
+
+    def _observe(self, severity: Severity) -> None:
+        rank = _SEVERITY_RANK.get(severity, 2)
+        if rank > self._status_rank:
+            self._status_rank = rank
+            self._status = severity
 
     def add_issue(
         self,
@@ -53,18 +79,17 @@ class ValidationCategoryReport:
                 fix_applied=fix_applied,
             )
         )
+        self._observe(severity)
 
     @property
     def status(self) -> Severity:
-        if not self.issues:
-            return "PASS"
-        return max((issue.severity for issue in self.issues), key=_severity_order)
+        return self._status
 
     def to_dict(self) -> Dict[str, Any]:
         return {
             "name": self.name,
             "status": self.status,
-            "issues": [issue.__dict__ for issue in self.issues],
+            "issues": [issue.to_dict() for issue in self.issues],
         }
 
 
@@ -74,6 +99,28 @@ class MeshMetrics:
     polygon_count: int
     layer_elements: Dict[str, int] = field(default_factory=dict)
 
+    def to_dict(self, *, copy: bool = True) -> Dict[str, Any]:
+        """Serialize the metrics; with ``copy=False`` the layer-element dict
+        is shared rather than copied, for read-only callers such as JSON
+        encoders."""
+
+        return {
+            "control_points": self.control_points,
+            "polygon_count": self.polygon_count,
+            "layer_elements": dict(self.layer_elements) if copy else self.layer_elements,
+        }
+
+
+_SCALAR_METRICS: Tuple[str, ...] = (
+    "node_count",
+    "material_count",
+    "texture_count",
+    "skin_cluster_count",
+    "bind_pose_count",
+    "anim_stack_count",
+    "anim_curve_count",
+)
+
 
 @dataclass
 class SceneMetrics:
@@ -90,54 +137,58 @@ class SceneMetrics:
         """Return metric differences compared to ``other``."""
 
         differences: List[Dict[str, Any]] = []
-
-        def record(label: str, expected: Any, actual: Any) -> None:
-            differences.append(
-                {
-                    "metric": label,
-                    "expected": expected,
-                    "actual": actual,
-                }
-            )
-
-        if self.node_count != other.node_count:
-            record("node_count", other.node_count, self.node_count)
-
-        if self.material_count != other.material_count:
-            record("material_count", other.material_count, self.material_count)
-
-        if self.texture_count != other.texture_count:
-            record("texture_count", other.texture_count, self.texture_count)
-
-        if self.skin_cluster_count != other.skin_cluster_count:
-            record("skin_cluster_count", other.skin_cluster_count, self.skin_cluster_count)
-
-        if self.bind_pose_count != other.bind_pose_count:
-            record("bind_pose_count", other.bind_pose_count, self.bind_pose_count)
-
-        if self.anim_stack_count != other.anim_stack_count:
-            record("anim_stack_count", other.anim_stack_count, self.anim_stack_count)
-
-        if self.anim_curve_count != other.anim_curve_count:
-            record("anim_curve_count", other.anim_curve_count, self.anim_curve_count)
-
-        mesh_keys = set(self.mesh_metrics) | set(other.mesh_metrics)
-        for key in sorted(mesh_keys):
-            lhs = self.mesh_metrics.get(key)
-            rhs = other.mesh_metrics.get(key)
-            if lhs is None or rhs is None:
-                record(f"mesh:{key}", rhs.__dict__ if rhs else None, lhs.__dict__ if lhs else None)
-                continue
-            if lhs.control_points != rhs.control_points:
-                record(f"mesh:{key}:control_points", rhs.control_points, lhs.control_points)
-            if lhs.polygon_count != rhs.polygon_count:
-                record(f"mesh:{key}:polygon_count", rhs.polygon_count, lhs.polygon_count)
-            layer_keys = set(lhs.layer_elements) | set(rhs.layer_elements)
-            for layer_key in sorted(layer_keys):
-                left_val = lhs.layer_elements.get(layer_key)
-                right_val = rhs.layer_elements.get(layer_key)
-                if left_val != right_val:
-                    record(f"mesh:{key}:layer:{layer_key}", right_val, left_val)
+        record = differences.append
+
+        for attr_name in _SCALAR_METRICS:
+            actual = getattr(self, attr_name)
+            expected = getattr(other, attr_name)
+            if actual != expected:
+                record({"metric": attr_name, "expected": expected, "actual": actual})
+
+        # Dataclass equality compares the whole mapping in C; the common
+        # round-trip case (identical meshes) skips the sorted walk entirely.
+        if self.mesh_metrics != other.mesh_metrics:
+            for key in sorted(self.mesh_metrics.keys() | other.mesh_metrics.keys()):
+                lhs = self.mesh_metrics.get(key)
+                rhs = other.mesh_metrics.get(key)
+                if lhs is None or rhs is None:
+                    record(
+                        {
+                            "metric": f"mesh:{key}",
+                            "expected": rhs.to_dict() if rhs else None,
+                            "actual": lhs.to_dict() if lhs else None,
+                        }
+                    )
+                    continue
+                if lhs == rhs:
+                    continue
+                if lhs.control_points != rhs.control_points:
+                    record(
+                        {
+                            "metric": f"mesh:{key}:control_points",
+                            "expected": rhs.control_points,
+                            "actual": lhs.control_points,
+                        }
+                    )
+                if lhs.polygon_count != rhs.polygon_count:
+                    record(
+                        {
+                            "metric": f"mesh:{key}:polygon_count",
+                            "expected": rhs.polygon_count,
+                            "actual": lhs.polygon_count,
+                        }
+                    )
+                for layer_key in sorted(lhs.layer_elements.keys() | rhs.layer_elements.keys()):
+                    left_val = lhs.layer_elements.get(layer_key)
+                    right_val = rhs.layer_elements.get(layer_key)
+                    if left_val != right_val:
+                        record(
+                            {
+                                "metric": f"mesh:{key}:layer:{layer_key}",
+                                "expected": right_val,
+                                "actual": left_val,
+                            }
+                        )
 
         return differences
 
@@ -152,34 +203,56 @@ class ValidationReport:
 
     @property
     def export_ready(self) -> bool:
-        return all(category.status != "FAIL" for category in self.categories.values())
+        # The cached rank makes each check O(1); the generator stops at the
+        # first failing category.
+        fail_rank = _SEVERITY_RANK["FAIL"]
+        return not any(
+            category._status_rank >= fail_rank for category in self.categories.values()
+        )
 
     def status_summary(self) -> Dict[str, Severity]:
         return {name: category.status for name, category in self.categories.items()}
 
-    def to_dict(self) -> Dict[str, Any]:
+    def to_dict(self, *, copy: bool = True) -> Dict[str, Any]:
+        """Serialize the report. ``copy=False`` shares the mutable leaf
+        containers (repairs, layer elements) instead of copying them; use it
+        only when the result is consumed read-only, e.g. dumped to JSON."""
+
+        metrics = self.metrics
         return {
             "categories": {name: category.to_dict() for name, category in self.categories.items()},
-            "repairs": list(self.repairs),
+            "repairs": list(self.repairs) if copy else self.repairs,
             "metrics": {
-                "node_count": self.metrics.node_count,
+                "node_count": metrics.node_count,
                 "mesh_metrics": {
-                    key: {
-                        "control_points": value.control_points,
-                        "polygon_count": value.polygon_count,
-                        "layer_elements": dict(value.layer_elements),
-                    }
-                    for key, value in self.metrics.mesh_metrics.items()
+                    key: value.to_dict(copy=copy) for key, value in metrics.mesh_metrics.items()
                 },
-                "material_count": self.metrics.material_count,
-                "texture_count": self.metrics.texture_count,
-                "skin_cluster_count": self.metrics.skin_cluster_count,
-                "bind_pose_count": self.metrics.bind_pose_count,
-                "anim_stack_count": self.metrics.anim_stack_count,
-                "anim_curve_count": self.metrics.anim_curve_count,
+                "material_count": metrics.material_count,
+                "texture_count": metrics.texture_count,
+                "skin_cluster_count": metrics.skin_cluster_count,
+                "bind_pose_count": metrics.bind_pose_count,
+                "anim_stack_count": metrics.anim_stack_count,
+                "anim_curve_count": metrics.anim_curve_count,
             },
         }
 
+    def to_json(self) -> bytes:
+        """Serialize the report to JSON bytes.
+
+        ``to_dict`` emits only str/int/float/list/dict, so orjson can take
+        its fast path when installed; otherwise the stdlib encoder handles
+        the same payload.
+        """
+
+        payload = self.to_dict(copy=False)
+        try:
+            import orjson  # type: ignore
+        except ImportError:
+            import json
+
+            return json.dumps(payload).encode("utf-8")
+        return orjson.dumps(payload)
+
 
 @dataclass
 class RoundTripDiffReport:
@@ -203,8 +276,16 @@ class CanonicalSettings:
     frame_rate: float
     time_span: Optional[Tuple[int, int]] = None
 
+    # Template cached by default(); the getattr probes against the SDK
+    # module only run once per process.
+    _CACHED: ClassVar[Optional["CanonicalSettings"]] = None
+
     @classmethod
     def default(cls) -> "CanonicalSettings":
+        if cls._CACHED is not None:
+            # Fresh copy per call: validate() fills time_span per scene,
+            # which must not leak between validators.
+            return replace(cls._CACHED)
         fbx, _ = sdk.import_fbx_module()
         axis_system = getattr(fbx.FbxAxisSystem, "MayaYUp", None)
         system_unit = getattr(fbx.FbxSystemUnit, "cm", None)
@@ -232,13 +313,14 @@ class CanonicalSettings:
                 frame_rate = float(time_class.GetFrameRate(time_mode))
             except Exception:  # pragma: no cover - defensive fallback
                 frame_rate = 30.0
-        return cls(
+        cls._CACHED = cls(
             axis_system=axis_system,
             system_unit=system_unit,
             time_mode=time_mode,
             frame_rate=frame_rate,
             time_span=None,
         )
+        return replace(cls._CACHED)
 
 
 class SceneValidator:
@@ -253,47 +335,126 @@ class SceneValidator:
         self.scene = scene
         self.fbx, _ = sdk.import_fbx_module()
         self.canonical = canonical_settings or CanonicalSettings.default()
+        # Filled by validate(); auto_repair reuses them to avoid re-walking.
+        self._all_nodes: List[Tuple[Any, str]] = []
+        self._mesh_nodes: List[Tuple[Any, Any, str]] = []
+        self._skin_clusters: List[Tuple[Any, str, Any, Any]] = []
+        self._timeline_span: Optional[Tuple[int, int]] = None
+        # FbxCriteria construction crosses the SDK boundary; build the two
+        # object-type filters once and reuse them across validation runs.
+        self._anim_stack_criteria = self.fbx.FbxCriteria.ObjectType(self.fbx.FbxAnimStack.ClassId)
+        self._constraint_criteria = self.fbx.FbxCriteria.ObjectType(self.fbx.FbxConstraint.ClassId)
 
     # Public API ---------------------------------------------------------
     def validate(self) -> ValidationReport:
         report = ValidationReport()
-        if self.canonical.time_span is None:
-            global_settings = self.scene.GetGlobalSettings()
-            get_default_span = getattr(global_settings, "GetTimelineDefaultTimeSpan", None)
-            if callable(get_default_span):
-                time_span = None
-                try:
-                    time_span = get_default_span()
-                except TypeError:
-                    time_span = self.fbx.FbxTimeSpan()
-                    get_default_span(time_span)
-                if time_span is not None:
-                    start = time_span.GetStart().Get()
-                    stop = time_span.GetStop().Get()
-                    if start < stop:
-                        self.canonical.time_span = (start, stop)
-        report.categories["globals"] = ValidateGlobals(self.scene, self.canonical, self.fbx)
-        report.categories["nodes"] = ValidateNodesAndTransforms(self.scene, self.fbx)
-        geometry_report, mesh_metrics = ValidateGeometry(self.scene, self.fbx)
-        report.categories["geometry"] = geometry_report
-        report.categories["skin"] = ValidateSkinAndPoses(self.scene, self.fbx)
-        report.categories["materials"] = ValidateMaterialsAndTextures(self.scene, self.fbx)
-        report.categories["animation"] = ValidateAnimation(self.scene, self.fbx)
-        report.categories["constraints"] = ValidateConstraints(self.scene, self.fbx)
-        report.categories["connections"] = ValidateConnections(self.scene, self.fbx)
-
-        report.metrics = collect_scene_metrics(self.scene, self.fbx, mesh_metrics)
+        # Read the timeline span once; ValidateGlobals reuses the parsed
+        # tuple instead of repeating the overload dance and allocating a
+        # second FbxTimeSpan.
+        self._timeline_span = _read_timeline_span(self.scene.GetGlobalSettings(), self.fbx)
+        if self.canonical.time_span is None and self._timeline_span is not None:
+            start, stop = self._timeline_span
+            if start < stop:
+                self.canonical.time_span = (start, stop)
+        # One traversal serves every validator below: the per-validator
+        # recursive walks each cost N GetChild/GetChildCount SDK crossings,
+        # so the flat (node, path) and (node, mesh, path) lists are built
+        # once and shared.
+        root = self.scene.GetRootNode()
+        nodes = _collect_nodes_with_paths(root) if root is not None else []
+        mesh_nodes = _collect_mesh_nodes(nodes, self.fbx)
+        self._all_nodes = nodes
+        self._mesh_nodes = mesh_nodes
+
+        report.categories["globals"] = ValidateGlobals(
+            self.scene, self.canonical, self.fbx, timeline_span=self._timeline_span
+        )
+        report.categories["nodes"] = ValidateNodesAndTransforms(self.scene, self.fbx, nodes=nodes)
+        mesh_reports, mesh_metrics = _validate_meshes_fused(self.scene, self.fbx, mesh_nodes)
+        report.categories["geometry"] = mesh_reports["geometry"]
+        report.categories["skin"] = mesh_reports["skin"]
+        report.categories["materials"] = mesh_reports["materials"]
+        report.categories["animation"] = ValidateAnimation(
+            self.scene, self.fbx, criteria=self._anim_stack_criteria
+        )
+        report.categories["constraints"] = ValidateConstraints(
+            self.scene, self.fbx, criteria=self._constraint_criteria
+        )
+        report.categories["connections"] = mesh_reports["connections"]
+
+        skin_clusters = _collect_skin_clusters(mesh_nodes, self.fbx)
+        self._skin_clusters = skin_clusters
+
+        report.metrics = collect_scene_metrics(
+            self.scene,
+            self.fbx,
+            mesh_metrics,
+            nodes=[node for node, _ in nodes],
+            skin_clusters=skin_clusters,
+        )
         return report
 
     def auto_repair(self, report: ValidationReport) -> None:
-        AutoRepair(report, self.scene, self.canonical, self.fbx)
+        cached = [node for node, _ in self._all_nodes] if self._all_nodes else None
+        paths = {path: node for node, path in self._all_nodes} if self._all_nodes else None
+        meshes = {path: mesh for _, mesh, path in self._mesh_nodes} if self._all_nodes else None
+        clusters: Optional[Dict[str, List[Any]]] = None
+        if self._all_nodes:
+            clusters = {path: [] for _, _, path in self._mesh_nodes}
+            for _, path, _, cluster in self._skin_clusters:
+                clusters[path].append(cluster)
+        AutoRepair(
+            report,
+            self.scene,
+            self.canonical,
+            self.fbx,
+            nodes=cached,
+            node_paths=paths,
+            mesh_paths=meshes,
+            clusters_by_path=clusters,
+        )
 
 
 # ---------------------------------------------------------------------------
 # Validators
 
 
-def ValidateGlobals(scene, canonical: CanonicalSettings, fbx_module) -> ValidationCategoryReport:  # type: ignore[valid-type]
+def _read_timeline_span(globals_settings, fbx_module) -> Optional[Tuple[int, int]]:  # type: ignore[valid-type]
+    """Read the timeline default span as raw ``(start, stop)`` time values.
+
+    Handles both binding overloads (fill-argument and returning) and returns
+    ``None`` when the accessor is unavailable. Callers share the parsed tuple
+    so the SDK round trip happens once per validation run.
+    """
+
+    timeline_getter = getattr(globals_settings, "GetTimelineDefaultTimeSpan", None)
+    if not callable(timeline_getter):
+        return None
+    time_span = fbx_module.FbxTimeSpan()
+    try:
+        result = timeline_getter(time_span)
+        # Some SDK variants return the span instead of filling the arg; prefer it.
+        if isinstance(result, fbx_module.FbxTimeSpan):
+            time_span = result
+    except TypeError:
+        # Older python bindings expose the no-arg overload returning the span.
+        result = timeline_getter()
+        if isinstance(result, fbx_module.FbxTimeSpan):
+            time_span = result
+    return (time_span.GetStart().Get(), time_span.GetStop().Get())
+
+
+# Sentinel distinguishing "caller did not supply a span" from "accessor
+# unavailable" (None), which is itself a reportable condition.
+_SPAN_UNREAD: Any = object()
+
+
+def ValidateGlobals(
+    scene,
+    canonical: CanonicalSettings,
+    fbx_module,
+    timeline_span: Optional[Tuple[int, int]] = _SPAN_UNREAD,
+) -> ValidationCategoryReport:  # type: ignore[valid-type]
     report = ValidationCategoryReport("GlobalSettings")
     globals_settings = scene.GetGlobalSettings()
 
@@ -353,7 +514,7 @@ def ValidateGlobals(scene, canonical: CanonicalSettings, fbx_module) -> Validati
         except Exception:  # pragma: no cover - defensive
             custom_rate = None
 
-    if canonical.time_mode == getattr(fbx_module.FbxTime, "eCustom", None):
+    if canonical.time_mode == _custom_time_mode(fbx_module):
         if custom_rate is None:
             report.add_issue(
                 "WARN",
@@ -369,20 +530,9 @@ def ValidateGlobals(scene, canonical: CanonicalSettings, fbx_module) -> Validati
                 object_path="<globals>",
             )
 
-    time_span = fbx_module.FbxTimeSpan()
-    timeline_getter = getattr(globals_settings, "GetTimelineDefaultTimeSpan", None)
-    if callable(timeline_getter):
-        try:
-            result = timeline_getter(time_span)
-            # Some SDK variants return the span instead of filling the arg; prefer it.
-            if isinstance(result, fbx_module.FbxTimeSpan):
-                time_span = result
-        except TypeError:
-            # Older python bindings expose the no-arg overload returning the span.
-            result = timeline_getter()
-            if isinstance(result, fbx_module.FbxTimeSpan):
-                time_span = result
-    else:  # pragma: no cover - defensive fallback
+    if timeline_span is _SPAN_UNREAD:
+        timeline_span = _read_timeline_span(globals_settings, fbx_module)
+    if timeline_span is None:  # pragma: no cover - defensive fallback
         report.add_issue(
             "WARN",
             "Timeline default time span accessor unavailable; unable to validate span.",
@@ -391,8 +541,7 @@ def ValidateGlobals(scene, canonical: CanonicalSettings, fbx_module) -> Validati
         )
         return report
 
-    start = time_span.GetStart().Get()
-    stop = time_span.GetStop().Get()
+    start, stop = timeline_span
     if start >= stop:
         report.add_issue(
             "FAIL",
@@ -404,26 +553,26 @@ def ValidateGlobals(scene, canonical: CanonicalSettings, fbx_module) -> Validati
     return report
 
 
-def ValidateNodesAndTransforms(scene, fbx_module) -> ValidationCategoryReport:  # type: ignore[valid-type]
+def ValidateNodesAndTransforms(
+    scene, fbx_module, nodes: Optional[List[Tuple[Any, str]]] = None
+) -> ValidationCategoryReport:  # type: ignore[valid-type]
     report = ValidationCategoryReport("NodesAndTransforms")
     root = scene.GetRootNode()
     if root is None:
         report.add_issue("FAIL", "Scene has no root node.", code="nodes.missing_root", object_path="/")
         return report
 
-    def iter_nodes(node):
-        yield node
-        for idx in range(node.GetChildCount()):
-            yield from iter_nodes(node.GetChild(idx))
+    if nodes is None:
+        nodes = _collect_nodes_with_paths(root)
 
-    for node in iter_nodes(root):
+    for node, path in nodes:
         attr = node.GetNodeAttribute()
         if node != root and attr is None:
             report.add_issue(
                 "WARN",
                 "Node has no attribute; downstream tools may ignore it.",
                 code="nodes.missing_attribute",
-                object_path=_node_path(node),
+                object_path=path,
             )
 
         try:
@@ -435,124 +584,136 @@ def ValidateNodesAndTransforms(scene, fbx_module) -> ValidationCategoryReport:
                 "FAIL",
                 "Failed to read local transforms for node.",
                 code="nodes.transform_read",
-                object_path=_node_path(node),
+                object_path=path,
             )
 
     return report
 
 
-def ValidateGeometry(scene, fbx_module) -> Tuple[ValidationCategoryReport, Dict[str, MeshMetrics]]:  # type: ignore[valid-type]
+def ValidateGeometry(
+    scene, fbx_module, mesh_nodes: Optional[List[Tuple[Any, Any, str]]] = None
+) -> Tuple[ValidationCategoryReport, Dict[str, MeshMetrics]]:  # type: ignore[valid-type]
     report = ValidationCategoryReport("Geometry")
     mesh_metrics: Dict[str, MeshMetrics] = {}
 
-    def iter_nodes(node):
-        yield node
-        for idx in range(node.GetChildCount()):
-            yield from iter_nodes(node.GetChild(idx))
-
     root = scene.GetRootNode()
     if root is None:
         return report, mesh_metrics
 
-    for node in iter_nodes(root):
-        attr = node.GetNodeAttribute()
-        if attr is None or not isinstance(attr, fbx_module.FbxMesh):
-            continue
-        mesh: Any = attr
-        path = _node_path(node)
-        control_points = mesh.GetControlPointsCount()
-        polygons = mesh.GetPolygonCount()
-        layer_counts: Dict[str, int] = {}
+    if mesh_nodes is None:
+        mesh_nodes = _collect_mesh_nodes(_collect_nodes_with_paths(root), fbx_module)
+
+    for node, mesh, path in mesh_nodes:
+        _validate_mesh_geometry(report, mesh_metrics, mesh, path, fbx_module)
+
+    return report, mesh_metrics
 
-        if control_points <= 0:
-            report.add_issue(
-                "FAIL",
-                "Mesh has no control points.",
-                code="geometry.control_points",
-                object_path=path,
-            )
-        if polygons <= 0:
-            report.add_issue(
-                "FAIL",
-                "Mesh has no polygons.",
-                code="geometry.polygons",
-                object_path=path,
-            )
 
-        layer_count = mesh.GetLayerCount()
-        for layer_index in range(layer_count):
-            layer = mesh.GetLayer(layer_index)
-            if layer is None:
+def _validate_mesh_geometry(
+    report: ValidationCategoryReport,
+    mesh_metrics: Dict[str, MeshMetrics],
+    mesh,
+    path: str,
+    fbx_module,
+) -> None:  # type: ignore[valid-type]
+    """Run the geometry checks for one mesh and record its metrics."""
+
+    control_points = mesh.GetControlPointsCount()
+    polygons = mesh.GetPolygonCount()
+    layer_counts: Dict[str, int] = {}
+
+    if control_points <= 0:
+        report.add_issue(
+            "FAIL",
+            "Mesh has no control points.",
+            code="geometry.control_points",
+            object_path=path,
+        )
+    if polygons <= 0:
+        report.add_issue(
+            "FAIL",
+            "Mesh has no polygons.",
+            code="geometry.polygons",
+            object_path=path,
+        )
+
+    layer_count = mesh.GetLayerCount()
+    for layer_index in range(layer_count):
+        layer = mesh.GetLayer(layer_index)
+        if layer is None:
+            continue
+        # Table-driven so each element's direct array is fetched and counted
+        # once, with the count handed to _validate_layer_element instead of
+        # being re-read there.
+        for getter, label, key in (
+            (layer.GetNormals, "Normals", "normals"),
+            (layer.GetTangents, "Tangents", "tangents"),
+            (layer.GetBinormals, "Binormals", "binormals"),
+        ):
+            element = getter()
+            if element is None:
                 continue
-            normals = layer.GetNormals()
-            if normals is not None:
-                _validate_layer_element(report, normals, "Normals", path, fbx_module)
-                layer_counts[f"normals:{layer_index}"] = normals.GetDirectArray().GetCount()
-            tangents = layer.GetTangents()
-            if tangents is not None:
-                _validate_layer_element(report, tangents, "Tangents", path, fbx_module)
-                layer_counts[f"tangents:{layer_index}"] = tangents.GetDirectArray().GetCount()
-            binormals = layer.GetBinormals()
-            if binormals is not None:
-                _validate_layer_element(report, binormals, "Binormals", path, fbx_module)
-                layer_counts[f"binormals:{layer_index}"] = binormals.GetDirectArray().GetCount()
-            uv_elements = []
-            get_uvset_count = getattr(layer, "GetUVSetCount", None)
-            get_uvset = getattr(layer, "GetUVSet", None)
-            if callable(get_uvset_count) and callable(get_uvset):
+            count = element.GetDirectArray().GetCount()
+            layer_counts[f"{key}:{layer_index}"] = count
+            _validate_layer_element(report, element, label, path, fbx_module, direct_count=count)
+        uv_elements = []
+        get_uvset_count = getattr(layer, "GetUVSetCount", None)
+        get_uvset = getattr(layer, "GetUVSet", None)
+        if callable(get_uvset_count) and callable(get_uvset):
+            try:
+                uv_count = int(get_uvset_count())
+            except TypeError:
+                uv_count = int(get_uvset_count) if isinstance(get_uvset_count, int) else 0
+            except Exception:
+                uv_count = 0
+            for uv_index in range(max(uv_count, 0)):
                 try:
-                    uv_count = int(get_uvset_count())
+                    uv_element = get_uvset(uv_index)
                 except TypeError:
-                    uv_count = int(get_uvset_count) if isinstance(get_uvset_count, int) else 0
-                except Exception:
-                    uv_count = 0
-                for uv_index in range(max(uv_count, 0)):
-                    try:
-                        uv_element = get_uvset(uv_index)
-                    except TypeError:
-                        uv_element = None
-                    if uv_element is not None:
-                        uv_elements.append((uv_index, uv_element))
-            else:
-                fallback = getattr(layer, "GetUVs", None)
-                uv_element = None
-                if callable(fallback):
-                    try:
-                        uv_element = fallback()
-                    except TypeError:
-                        uv_element = fallback
-                elif fallback is not None:
-                    uv_element = fallback
+                    uv_element = None
                 if uv_element is not None:
-                    uv_elements.append((0, uv_element))
+                    uv_elements.append((uv_index, uv_element))
+        else:
+            fallback = getattr(layer, "GetUVs", None)
+            uv_element = None
+            if callable(fallback):
+                try:
+                    uv_element = fallback()
+                except TypeError:
+                    uv_element = fallback
+            elif fallback is not None:
+                uv_element = fallback
+            if uv_element is not None:
+                uv_elements.append((0, uv_element))
 
-            for uv_index, uv_element in uv_elements:
-                if uv_element is None:
-                    continue
-                _validate_layer_element(report, uv_element, f"UVSet[{uv_index}]", path, fbx_module)
-                direct_array = getattr(uv_element, "GetDirectArray", lambda: None)()
-                if direct_array is not None:
-                    layer_counts[f"uv{uv_index}:{layer_index}"] = direct_array.GetCount()
-            vertex_colors = layer.GetVertexColors()
-            if vertex_colors is not None:
-                _validate_layer_element(report, vertex_colors, "VertexColors", path, fbx_module)
-                layer_counts[f"vcolor:{layer_index}"] = vertex_colors.GetDirectArray().GetCount()
-            smoothing = layer.GetSmoothing()
-            if smoothing is not None:
-                _validate_layer_element(report, smoothing, "Smoothing", path, fbx_module)
-                layer_counts[f"smoothing:{layer_index}"] = smoothing.GetDirectArray().GetCount()
-            materials = layer.GetMaterials()
-            if materials is not None:
-                _validate_layer_element(report, materials, "Materials", path, fbx_module)
-                layer_counts[f"materials:{layer_index}"] = materials.GetDirectArray().GetCount()
-
-        mesh_metrics[path] = MeshMetrics(
-            control_points=control_points,
-            polygon_count=polygons,
-            layer_elements=layer_counts,
-        )
+        for uv_index, uv_element in uv_elements:
+            if uv_element is None:
+                continue
+            direct_array = getattr(uv_element, "GetDirectArray", lambda: None)()
+            uv_direct_count = direct_array.GetCount() if direct_array is not None else None
+            if uv_direct_count is not None:
+                layer_counts[f"uv{uv_index}:{layer_index}"] = uv_direct_count
+            _validate_layer_element(
+                report, uv_element, f"UVSet[{uv_index}]", path, fbx_module,
+                direct_count=uv_direct_count,
+            )
+        for getter, label, key in (
+            (layer.GetVertexColors, "VertexColors", "vcolor"),
+            (layer.GetSmoothing, "Smoothing", "smoothing"),
+            (layer.GetMaterials, "Materials", "materials"),
+        ):
+            element = getter()
+            if element is None:
+                continue
+            count = element.GetDirectArray().GetCount()
+            layer_counts[f"{key}:{layer_index}"] = count
+            _validate_layer_element(report, element, label, path, fbx_module, direct_count=count)
 
-    return report, mesh_metrics
+    mesh_metrics[path] = MeshMetrics(
+        control_points=control_points,
+        polygon_count=polygons,
+        layer_elements=layer_counts,
+    )
 
 
 def _iter_skin_deformers(geometry, fbx_module):  # type: ignore[valid-type]
@@ -642,72 +803,87 @@ def _get_cluster_weight_count(cluster) -> int:
     return 0
 
 
-def ValidateSkinAndPoses(scene, fbx_module) -> ValidationCategoryReport:  # type: ignore[valid-type]
+def ValidateSkinAndPoses(
+    scene, fbx_module, mesh_nodes: Optional[List[Tuple[Any, Any, str]]] = None
+) -> ValidationCategoryReport:  # type: ignore[valid-type]
     report = ValidationCategoryReport("SkinningAndPoses")
     root = scene.GetRootNode()
     if root is None:
         return report
 
-    def iter_nodes(node):
-        yield node
-        for idx in range(node.GetChildCount()):
-            yield from iter_nodes(node.GetChild(idx))
+    if mesh_nodes is None:
+        mesh_nodes = _collect_mesh_nodes(_collect_nodes_with_paths(root), fbx_module)
 
-    for node in iter_nodes(root):
-        attr = node.GetNodeAttribute()
-        if attr is None or not isinstance(attr, fbx_module.FbxMesh):
-            continue
-        mesh: Any = attr
-        path = _node_path(node)
+    for node, mesh, path in mesh_nodes:
         skin_deformers = list(_iter_skin_deformers(mesh, fbx_module))
-        for skin_index, skin in enumerate(skin_deformers):
-            if skin is None:
+        _validate_mesh_skin(report, skin_deformers, path, fbx_module)
+
+    _validate_scene_poses(report, scene)
+
+    return report
+
+
+def _validate_mesh_skin(
+    report: ValidationCategoryReport, skin_deformers, path: str, fbx_module
+) -> None:  # type: ignore[valid-type]
+    """Run the skin-cluster checks for one mesh's deformers."""
+
+    if not skin_deformers:
+        return
+    # The SDK fills the matrices in place and only the return codes are
+    # inspected, so one scratch pair serves every cluster.
+    matrix = fbx_module.FbxAMatrix()
+    link_matrix = fbx_module.FbxAMatrix()
+    for skin in skin_deformers:
+        if skin is None:
+            continue
+        cluster_count = skin.GetClusterCount()
+        if cluster_count == 0:
+            report.add_issue(
+                "FAIL",
+                "Skin deformer has no clusters.",
+                code="skin.no_clusters",
+                object_path=path,
+            )
+            continue
+        for cluster_index in range(cluster_count):
+            cluster = skin.GetCluster(cluster_index)
+            if cluster is None:
                 continue
-            cluster_count = skin.GetClusterCount()
-            if cluster_count == 0:
+            link = cluster.GetLink()
+            if link is None:
                 report.add_issue(
                     "FAIL",
-                    "Skin deformer has no clusters.",
-                    code="skin.no_clusters",
+                    "Skin cluster missing joint link.",
+                    code="skin.cluster_link",
                     object_path=path,
                 )
-                continue
-            for cluster_index in range(cluster_count):
-                cluster = skin.GetCluster(cluster_index)
-                if cluster is None:
-                    continue
-                link = cluster.GetLink()
-                if link is None:
-                    report.add_issue(
-                        "FAIL",
-                        "Skin cluster missing joint link.",
-                        code="skin.cluster_link",
-                        object_path=path,
-                    )
-                weight_count = _get_cluster_weight_count(cluster)
-                if cluster.GetControlPointIndicesCount() == 0 or weight_count == 0:
-                    report.add_issue(
-                        "FAIL",
-                        "Skin cluster has empty weights.",
-                        code="skin.cluster_weights",
-                        object_path=path,
-                    )
-                matrix = fbx_module.FbxAMatrix()
-                link_matrix = fbx_module.FbxAMatrix()
-                if not cluster.GetTransformMatrix(matrix):
-                    report.add_issue(
-                        "FAIL",
-                        "Skin cluster missing transform matrix.",
-                        code="skin.cluster_matrix",
-                        object_path=path,
-                    )
-                if not cluster.GetTransformLinkMatrix(link_matrix):
-                    report.add_issue(
-                        "FAIL",
-                        "Skin cluster missing link matrix.",
-                        code="skin.cluster_link_matrix",
-                        object_path=path,
-                    )
+            weight_count = _get_cluster_weight_count(cluster)
+            if cluster.GetControlPointIndicesCount() == 0 or weight_count == 0:
+                report.add_issue(
+                    "FAIL",
+                    "Skin cluster has empty weights.",
+                    code="skin.cluster_weights",
+                    object_path=path,
+                )
+            if not cluster.GetTransformMatrix(matrix):
+                report.add_issue(
+                    "FAIL",
+                    "Skin cluster missing transform matrix.",
+                    code="skin.cluster_matrix",
+                    object_path=path,
+                )
+            if not cluster.GetTransformLinkMatrix(link_matrix):
+                report.add_issue(
+                    "FAIL",
+                    "Skin cluster missing link matrix.",
+                    code="skin.cluster_link_matrix",
+                    object_path=path,
+                )
+
+
+def _validate_scene_poses(report: ValidationCategoryReport, scene) -> None:  # type: ignore[valid-type]
+    """Check that the scene carries a usable bind pose."""
 
     bind_pose_found = False
     for pose_index in range(scene.GetPoseCount()):
@@ -729,53 +905,56 @@ def ValidateSkinAndPoses(scene, fbx_module) -> ValidationCategoryReport:  # type
             object_path="<poses>",
         )
 
-    return report
-
 
-def ValidateMaterialsAndTextures(scene, fbx_module) -> ValidationCategoryReport:  # type: ignore[valid-type]
+def ValidateMaterialsAndTextures(
+    scene, fbx_module, mesh_nodes: Optional[List[Tuple[Any, Any, str]]] = None
+) -> ValidationCategoryReport:  # type: ignore[valid-type]
     report = ValidationCategoryReport("MaterialsAndTextures")
     root = scene.GetRootNode()
     if root is None:
         return report
 
-    def iter_nodes(node):
-        yield node
-        for idx in range(node.GetChildCount()):
-            yield from iter_nodes(node.GetChild(idx))
+    if mesh_nodes is None:
+        mesh_nodes = _collect_mesh_nodes(_collect_nodes_with_paths(root), fbx_module)
 
-    for node in iter_nodes(root):
-        attr = node.GetNodeAttribute()
-        if attr is None or not isinstance(attr, fbx_module.FbxMesh):
-            continue
-        mesh: Any = attr
-        path = _node_path(node)
-        material_count = node.GetMaterialCount()
-        if material_count == 0 and mesh.GetElementMaterialCount() > 0:
+    for node, mesh, path in mesh_nodes:
+        _validate_mesh_materials(report, node, mesh, path, fbx_module)
+
+    return report
+
+
+def _validate_mesh_materials(
+    report: ValidationCategoryReport, node, mesh, path: str, fbx_module
+) -> None:  # type: ignore[valid-type]
+    """Run the material and texture checks for one mesh node."""
+
+    material_count = node.GetMaterialCount()
+    if material_count == 0 and mesh.GetElementMaterialCount() > 0:
+        report.add_issue(
+            "FAIL",
+            "Mesh has material layer but node has no materials assigned.",
+            code="materials.node_assignment",
+            object_path=path,
+        )
+
+    for material_index in range(material_count):
+        material = node.GetMaterial(material_index)
+        if material is None:
             report.add_issue(
                 "FAIL",
-                "Mesh has material layer but node has no materials assigned.",
-                code="materials.node_assignment",
+                "Material slot references a missing material.",
+                code="materials.missing",
                 object_path=path,
             )
-
-        for material_index in range(node.GetMaterialCount()):
-            material = node.GetMaterial(material_index)
-            if material is None:
-                report.add_issue(
-                    "FAIL",
-                    "Material slot references a missing material.",
-                    code="materials.missing",
-                    object_path=path,
-                )
-                continue
-            _validate_material_textures(report, material, path, fbx_module)
-
-    return report
+            continue
+        _validate_material_textures(report, material, path, fbx_module)
 
 
-def ValidateAnimation(scene, fbx_module) -> ValidationCategoryReport:  # type: ignore[valid-type]
+def ValidateAnimation(scene, fbx_module, criteria=None) -> ValidationCategoryReport:  # type: ignore[valid-type]
     report = ValidationCategoryReport("Animation")
-    anim_stack_count = scene.GetSrcObjectCount(fbx_module.FbxCriteria.ObjectType(fbx_module.FbxAnimStack.ClassId))
+    if criteria is None:
+        criteria = fbx_module.FbxCriteria.ObjectType(fbx_module.FbxAnimStack.ClassId)
+    anim_stack_count = scene.GetSrcObjectCount(criteria)
     if anim_stack_count == 0:
         report.add_issue(
             "WARN",
@@ -786,7 +965,7 @@ def ValidateAnimation(scene, fbx_module) -> ValidationCategoryReport:  # type: i
         return report
 
     for stack_index in range(anim_stack_count):
-        stack = scene.GetSrcObject(fbx_module.FbxCriteria.ObjectType(fbx_module.FbxAnimStack.ClassId), stack_index)
+        stack = scene.GetSrcObject(criteria, stack_index)
         if stack is None:
             continue
         span = stack.GetLocalTimeSpan()
@@ -809,9 +988,10 @@ def ValidateAnimation(scene, fbx_module) -> ValidationCategoryReport:  # type: i
     return report
 
 
-def ValidateConstraints(scene, fbx_module) -> ValidationCategoryReport:  # type: ignore[valid-type]
+def ValidateConstraints(scene, fbx_module, criteria=None) -> ValidationCategoryReport:  # type: ignore[valid-type]
     report = ValidationCategoryReport("Constraints")
-    criteria = fbx_module.FbxCriteria.ObjectType(fbx_module.FbxConstraint.ClassId)
+    if criteria is None:
+        criteria = fbx_module.FbxCriteria.ObjectType(fbx_module.FbxConstraint.ClassId)
     constraint_count = scene.GetSrcObjectCount(criteria)
     for index in range(constraint_count):
         constraint = scene.GetSrcObject(criteria, index)
@@ -827,196 +1007,313 @@ def ValidateConstraints(scene, fbx_module) -> ValidationCategoryReport:  # type:
     return report
 
 
-def ValidateConnections(scene, fbx_module) -> ValidationCategoryReport:  # type: ignore[valid-type]
+def ValidateConnections(
+    scene, fbx_module, mesh_nodes: Optional[List[Tuple[Any, Any, str]]] = None
+) -> ValidationCategoryReport:  # type: ignore[valid-type]
     report = ValidationCategoryReport("Connections")
     root = scene.GetRootNode()
     if root is None:
         return report
 
-    def iter_nodes(node):
-        yield node
-        for idx in range(node.GetChildCount()):
-            yield from iter_nodes(node.GetChild(idx))
+    if mesh_nodes is None:
+        mesh_nodes = _collect_mesh_nodes(_collect_nodes_with_paths(root), fbx_module)
 
-    for node in iter_nodes(root):
-        attr = node.GetNodeAttribute()
-        if isinstance(attr, fbx_module.FbxMesh):
-            skin_deformers = list(_iter_skin_deformers(attr, fbx_module))
-            if skin_deformers:
-                has_cluster_links = False
-                for skin in skin_deformers:
-                    if skin is None:
-                        continue
-                    for cluster_index in range(skin.GetClusterCount()):
-                        cluster = skin.GetCluster(cluster_index)
-                        if cluster is not None and cluster.GetLink() is not None:
-                            has_cluster_links = True
-                            break
-                    if has_cluster_links:
-                        break
-                if not has_cluster_links:
-                    report.add_issue(
-                        "FAIL",
-                        "Skinned mesh lacks valid joint connections.",
-                        code="connections.mesh_skin_links",
-                        object_path=_node_path(node),
-                    )
-            if node.GetMaterialCount() > 0 and attr.GetElementMaterialCount() == 0:
-                report.add_issue(
-                    "WARN",
-                    "Mesh has materials assigned but no material layer element.",
-                    code="connections.material_layer",
-                    object_path=_node_path(node),
-                )
+    for node, mesh, path in mesh_nodes:
+        skin_deformers = list(_iter_skin_deformers(mesh, fbx_module))
+        _validate_mesh_connections(report, node, mesh, skin_deformers, path)
 
     return report
 
 
+def _validate_mesh_connections(
+    report: ValidationCategoryReport, node, mesh, skin_deformers, path: str
+) -> None:  # type: ignore[valid-type]
+    """Run the connection checks for one mesh node."""
+
+    if skin_deformers:
+        # any() short-circuits at the first linked cluster without the
+        # flag-and-break bookkeeping.
+        has_cluster_links = any(
+            cluster.GetLink() is not None
+            for skin in skin_deformers
+            if skin is not None
+            for cluster in (skin.GetCluster(idx) for idx in range(skin.GetClusterCount()))
+            if cluster is not None
+        )
+        if not has_cluster_links:
+            report.add_issue(
+                "FAIL",
+                "Skinned mesh lacks valid joint connections.",
+                code="connections.mesh_skin_links",
+                object_path=path,
+            )
+    if node.GetMaterialCount() > 0 and mesh.GetElementMaterialCount() == 0:
+        report.add_issue(
+            "WARN",
+            "Mesh has materials assigned but no material layer element.",
+            code="connections.material_layer",
+            object_path=path,
+        )
+
+
+def _validate_meshes_fused(
+    scene, fbx_module, mesh_nodes: List[Tuple[Any, Any, str]]
+) -> Tuple[Dict[str, ValidationCategoryReport], Dict[str, MeshMetrics]]:  # type: ignore[valid-type]
+    """Run the four mesh-walking validators in a single pass per mesh.
+
+    Each mesh is visited exactly once and its skin-deformer list is shared
+    between the skin and connection checks, instead of four validators
+    re-filtering and re-querying the same meshes. Results land in the same
+    category reports the standalone validators produce.
+    """
+
+    geometry = ValidationCategoryReport("Geometry")
+    skin = ValidationCategoryReport("SkinningAndPoses")
+    materials = ValidationCategoryReport("MaterialsAndTextures")
+    connections = ValidationCategoryReport("Connections")
+    mesh_metrics: Dict[str, MeshMetrics] = {}
+
+    for node, mesh, path in mesh_nodes:
+        _validate_mesh_geometry(geometry, mesh_metrics, mesh, path, fbx_module)
+        skin_deformers = list(_iter_skin_deformers(mesh, fbx_module))
+        _validate_mesh_skin(skin, skin_deformers, path, fbx_module)
+        _validate_mesh_materials(materials, node, mesh, path, fbx_module)
+        _validate_mesh_connections(connections, node, mesh, skin_deformers, path)
+
+    _validate_scene_poses(skin, scene)
+
+    reports = {
+        "geometry": geometry,
+        "skin": skin,
+        "materials": materials,
+        "connections": connections,
+    }
+    return reports, mesh_metrics
+
+
 # ---------------------------------------------------------------------------
 # Auto repair helpers
 
 
+def _repair_axis(globals_settings, canonical: CanonicalSettings, fbx_module) -> Optional[str]:  # type: ignore[valid-type]
+    if canonical.axis_system is None:
+        return None
+    globals_settings.SetAxisSystem(canonical.axis_system)
+    return "Axis system reset to canonical orientation."
+
+
+def _repair_unit(globals_settings, canonical: CanonicalSettings, fbx_module) -> Optional[str]:  # type: ignore[valid-type]
+    if canonical.system_unit is None:
+        return None
+    globals_settings.SetSystemUnit(canonical.system_unit)
+    return "System unit reset to canonical scale."
+
+
+@functools.lru_cache(maxsize=None)
+def _coerce_time_mode(fbx_module, mode_int: int) -> Optional[Any]:  # type: ignore[valid-type]
+    """Coerce an integer time mode into ``FbxTime.EMode`` once per module.
+
+    Some SDK builds reject plain integers in ``SetTimeMode``; the enum
+    lookup and construction are deterministic, so the result is cached
+    rather than rebuilt on every repair.
+    """
+
+    time_class = getattr(fbx_module, "FbxTime", None)
+    mode_enum = getattr(time_class, "EMode", None) if time_class else None
+    if mode_enum is None:
+        return None
+    try:
+        return mode_enum(mode_int)
+    except Exception:  # pragma: no cover - defensive fallback
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def _custom_time_mode(fbx_module) -> Any:  # type: ignore[valid-type]
+    """Resolve ``FbxTime.eCustom`` once per module."""
+
+    return getattr(fbx_module.FbxTime, "eCustom", None)
+
+
+def _repair_time_mode(globals_settings, canonical: CanonicalSettings, fbx_module) -> Optional[str]:  # type: ignore[valid-type]
+    if canonical.time_mode is None:
+        return None
+    try:
+        globals_settings.SetTimeMode(canonical.time_mode)
+    except TypeError:
+        # Some SDKs expect an explicit FbxTime.EMode; attempt to coerce
+        coerced_mode = None
+        if isinstance(canonical.time_mode, int):
+            coerced_mode = _coerce_time_mode(fbx_module, canonical.time_mode)
+        if coerced_mode is not None:
+            globals_settings.SetTimeMode(coerced_mode)
+        else:  # pragma: no cover - defensive fallback
+            return "Unable to reset time mode due to incompatible SDK signature."
+
+    if canonical.time_mode == _custom_time_mode(fbx_module):
+        set_custom_rate = getattr(globals_settings, "SetCustomFrameRate", None)
+        if callable(set_custom_rate):
+            set_custom_rate(canonical.frame_rate)
+        else:  # pragma: no cover - defensive fallback
+            return "Time mode set, but custom frame-rate setter unavailable on this SDK."
+
+    return "Time mode reset to canonical mode."
+
+
+def _repair_frame_rate(globals_settings, canonical: CanonicalSettings, fbx_module) -> Optional[str]:  # type: ignore[valid-type]
+    if canonical.time_mode != _custom_time_mode(fbx_module):
+        return None
+    set_custom_rate = getattr(globals_settings, "SetCustomFrameRate", None)
+    if callable(set_custom_rate):
+        set_custom_rate(canonical.frame_rate)
+        return "Custom frame rate synced to canonical value."
+    # pragma: no cover - defensive fallback
+    return "Unable to set custom frame rate; setter unavailable."
+
+
+def _repair_time_span(globals_settings, canonical: CanonicalSettings, fbx_module) -> Optional[str]:  # type: ignore[valid-type]
+    span = fbx_module.FbxTimeSpan()
+    globals_settings.GetTimelineDefaultTimeSpan(span)
+    start_time = fbx_module.FbxTime()
+    stop_time = fbx_module.FbxTime()
+    if canonical.time_span is not None:
+        start_time.Set(canonical.time_span[0])
+        stop_time.Set(canonical.time_span[1])
+    else:
+        # Fallback to minimal frame range if unknown.
+        start_time.Set(0)
+        stop_time.Set(int(fbx_module.FbxTime.GetOneFrameValue()))
+    span.SetStart(start_time)
+    span.SetStop(stop_time)
+    globals_settings.SetTimelineDefaultTimeSpan(span)
+    return "Global time span reset to a valid range."
+
+
+# Dispatch table for global-settings repairs: code -> handler returning the
+# fix_applied message, or None when the repair does not apply.
+_GLOBAL_REPAIRS: Dict[str, Callable[..., Optional[str]]] = {
+    "globals.axis": _repair_axis,
+    "globals.system_unit": _repair_unit,
+    "globals.time_mode": _repair_time_mode,
+    "globals.frame_rate": _repair_frame_rate,
+    "globals.time_span": _repair_time_span,
+}
+
+
 def AutoRepair(
     report: ValidationReport,
     scene,
     canonical: CanonicalSettings,
     fbx_module,
+    nodes: Optional[List[Any]] = None,
+    node_paths: Optional[Dict[str, Any]] = None,
+    mesh_paths: Optional[Dict[str, Any]] = None,
+    clusters_by_path: Optional[Dict[str, List[Any]]] = None,
 ) -> None:  # type: ignore[valid-type]
-    """Attempt to repair known issues in the scene."""
+    """Attempt to repair known issues in the scene.
+
+    ``nodes`` optionally supplies the flat node list from a prior traversal
+    so the bind-pose rebuild does not re-walk the hierarchy, ``node_paths``
+    a path->node mapping so issue paths resolve with a dict lookup instead
+    of a per-issue tree search, ``mesh_paths`` a path->mesh mapping that
+    skips the attribute probe for mesh-targeted issues, and
+    ``clusters_by_path`` already-flattened skin clusters per mesh path
+    (with an entry for every mesh), sparing the deformer re-enumeration.
+    """
 
     globals_settings = scene.GetGlobalSettings()
 
     for issue in list(report.categories.get("globals", ValidationCategoryReport("globals")).issues):
-        if issue.code == "globals.axis" and canonical.axis_system is not None:
-            globals_settings.SetAxisSystem(canonical.axis_system)
-            issue.fix_applied = "Axis system reset to canonical orientation."
-            report.repairs.append(
-                {"object": issue.object_path or "<globals>", "action": issue.fix_applied}
-            )
-        elif issue.code == "globals.system_unit" and canonical.system_unit is not None:
-            globals_settings.SetSystemUnit(canonical.system_unit)
-            issue.fix_applied = "System unit reset to canonical scale."
-            report.repairs.append(
-                {"object": issue.object_path or "<globals>", "action": issue.fix_applied}
-            )
-        elif issue.code == "globals.time_mode" and canonical.time_mode is not None:
-            try:
-                globals_settings.SetTimeMode(canonical.time_mode)
-            except TypeError:
-                # Some SDKs expect an explicit FbxTime.EMode; attempt to coerce
-                coerced_mode = None
-                time_class = getattr(fbx_module, "FbxTime", None)
-                mode_enum = getattr(time_class, "EMode", None) if time_class else None
-                if mode_enum is not None and isinstance(canonical.time_mode, int):
-                    try:
-                        coerced_mode = mode_enum(canonical.time_mode)
-                    except Exception:  # pragma: no cover - defensive fallback
-                        coerced_mode = None
-                if coerced_mode is not None:
-                    globals_settings.SetTimeMode(coerced_mode)
-                else:  # pragma: no cover - defensive fallback
-                    issue.fix_applied = (
-                        "Unable to reset time mode due to incompatible SDK signature."
-                    )
-                    report.repairs.append(
-                        {"object": issue.object_path or "<globals>", "action": issue.fix_applied}
-                    )
-                    continue
-
-            if canonical.time_mode == getattr(fbx_module.FbxTime, "eCustom", None):
-                set_custom_rate = getattr(globals_settings, "SetCustomFrameRate", None)
-                if callable(set_custom_rate):
-                    set_custom_rate(canonical.frame_rate)
-                else:  # pragma: no cover - defensive fallback
-                    issue.fix_applied = (
-                        "Time mode set, but custom frame-rate setter unavailable on this SDK."
-                    )
-                    report.repairs.append(
-                        {"object": issue.object_path or "<globals>", "action": issue.fix_applied}
-                    )
-                    continue
-
-            issue.fix_applied = "Time mode reset to canonical mode."
-            report.repairs.append(
-                {"object": issue.object_path or "<globals>", "action": issue.fix_applied}
-            )
-        elif issue.code == "globals.frame_rate" and canonical.time_mode == getattr(
-            fbx_module.FbxTime, "eCustom", None
-        ):
-            set_custom_rate = getattr(globals_settings, "SetCustomFrameRate", None)
-            if callable(set_custom_rate):
-                set_custom_rate(canonical.frame_rate)
-                issue.fix_applied = "Custom frame rate synced to canonical value."
-            else:  # pragma: no cover - defensive fallback
-                issue.fix_applied = "Unable to set custom frame rate; setter unavailable."
-            report.repairs.append(
-                {"object": issue.object_path or "<globals>", "action": issue.fix_applied}
-            )
-        elif issue.code == "globals.time_span":
-            span = fbx_module.FbxTimeSpan()
-            scene.GetGlobalSettings().GetTimelineDefaultTimeSpan(span)
-            if canonical.time_span is not None:
-                start_time = fbx_module.FbxTime()
-                stop_time = fbx_module.FbxTime()
-                start_time.Set(canonical.time_span[0])
-                stop_time.Set(canonical.time_span[1])
-                span.SetStart(start_time)
-                span.SetStop(stop_time)
-            else:
-                # Fallback to minimal frame range if unknown.
-                start_time = fbx_module.FbxTime()
-                stop_time = fbx_module.FbxTime()
-                start_time.Set(0)
-                stop_time.Set(int(fbx_module.FbxTime.GetOneFrameValue()))
-                span.SetStart(start_time)
-                span.SetStop(stop_time)
-            globals_settings.SetTimelineDefaultTimeSpan(span)
-            issue.fix_applied = "Global time span reset to a valid range."
-            report.repairs.append(
-                {"object": issue.object_path or "<globals>", "action": issue.fix_applied}
-            )
+        repair = _GLOBAL_REPAIRS.get(issue.code)
+        if repair is None:
+            continue
+        fix = repair(globals_settings, canonical, fbx_module)
+        if fix is None:
+            continue
+        issue.fix_applied = fix
+        report.repairs.append({"object": issue.object_path or "<globals>", "action": fix})
 
     root = scene.GetRootNode()
     if root is None:
         return
 
-    def iter_nodes(node):
-        yield node
-        for idx in range(node.GetChildCount()):
-            yield from iter_nodes(node.GetChild(idx))
+    # Global transforms are memoized per node for this repair pass:
+    # EvaluateGlobalTransform recomputes the parent chain each call, and
+    # cluster links recur across clusters and meshes.
+    global_xforms: Dict[int, Any] = {}
+
+    def _global_transform(target):
+        key = id(target)
+        xform = global_xforms.get(key)
+        if xform is None:
+            xform = target.EvaluateGlobalTransform()
+            global_xforms[key] = xform
+        return xform
 
     # Repair skinning matrices and bind poses if required.
     skin_category = report.categories.get("skin")
     needs_bind_pose = False
     if skin_category is not None:
+        mesh_class = fbx_module.FbxMesh
+        # Matrix and link-matrix issues usually travel together for the same
+        # mesh; bucket them per path so each mesh's deformers are walked once
+        # with every applicable fix applied in that pass.
+        matrix_issues_by_path: Dict[str, List[ValidationIssue]] = {}
         for issue in skin_category.issues:
-            path = issue.object_path or "<mesh>"
             if issue.code in {"skin.cluster_matrix", "skin.cluster_link_matrix"}:
-                node = _find_node_by_path(root, path)
-                if node is None:
-                    continue
-                mesh_attr = node.GetNodeAttribute()
-                if not isinstance(mesh_attr, fbx_module.FbxMesh):
-                    continue
-                mesh_matrix = node.EvaluateGlobalTransform()
-                for skin in _iter_skin_deformers(mesh_attr, fbx_module):
-                    if skin is None:
-                        continue
-                    for cluster_index in range(skin.GetClusterCount()):
-                        cluster = skin.GetCluster(cluster_index)
-                        if cluster is None:
-                            continue
-                        if issue.code == "skin.cluster_matrix":
-                            cluster.SetTransformMatrix(mesh_matrix)
-                        link = cluster.GetLink()
-                        if link is not None:
-                            link_matrix = link.EvaluateGlobalTransform()
-                            cluster.SetTransformLinkMatrix(link_matrix)
-                issue.fix_applied = "Skin cluster matrices rebuilt from current pose."
-                report.repairs.append({"object": path, "action": issue.fix_applied})
+                path = issue.object_path or "<mesh>"
+                matrix_issues_by_path.setdefault(path, []).append(issue)
             elif issue.code in {"skin.bind_pose_missing", "skin.bind_pose_empty"}:
                 needs_bind_pose = True
 
+        if matrix_issues_by_path and node_paths is None:
+            # Built lazily: only scenes with matrix issues pay for it, and
+            # one walk serves every issue.
+            node_paths = {p: n for n, p in _collect_nodes_with_paths(root)}
+
+        for path, path_issues in matrix_issues_by_path.items():
+            node = node_paths.get(path)
+            if node is None:
+                continue
+            if clusters_by_path is not None:
+                clusters = clusters_by_path.get(path)
+            else:
+                if mesh_paths is not None:
+                    mesh_attr = mesh_paths.get(path)
+                else:
+                    mesh_attr = node.GetNodeAttribute()
+                    if not isinstance(mesh_attr, mesh_class):
+                        mesh_attr = None
+                if mesh_attr is None:
+                    clusters = None
+                else:
+                    clusters = [
+                        cluster
+                        for skin in _iter_skin_deformers(mesh_attr, fbx_module)
+                        if skin is not None
+                        for cluster in (
+                            skin.GetCluster(index)
+                            for index in range(skin.GetClusterCount())
+                        )
+                        if cluster is not None
+                    ]
+            if clusters is None:
+                # Path does not resolve to a mesh; leave the issue unfixed.
+                continue
+            fix_transform = any(
+                issue.code == "skin.cluster_matrix" for issue in path_issues
+            )
+            mesh_matrix = _global_transform(node) if fix_transform else None
+            for cluster in clusters:
+                if fix_transform:
+                    cluster.SetTransformMatrix(mesh_matrix)
+                link = cluster.GetLink()
+                if link is not None:
+                    cluster.SetTransformLinkMatrix(_global_transform(link))
+            for issue in path_issues:
+                issue.fix_applied = "Skin cluster matrices rebuilt from current pose."
+                report.repairs.append({"object": path, "action": issue.fix_applied})
+
     if needs_bind_pose:
         pose = fbx_module.FbxPose.Create(scene, "AutoBindPose")
         pose.SetIsBindPose(True)
@@ -1053,8 +1350,10 @@ def AutoRepair(
                     return matrix_instance
             return None
 
-        for node in iter_nodes(root):
-            matrix = node.EvaluateGlobalTransform()
+        if nodes is None:
+            nodes = list(iter_nodes(root))
+        for node in nodes:
+            matrix = _global_transform(node)
             matrix_value = _to_fbx_matrix(fbx_module, matrix)
             if matrix_value is None:
                 fallback_ctor = getattr(fbx_module, "FbxMatrix", None)
@@ -1072,48 +1371,163 @@ def AutoRepair(
                     issue.fix_applied = "Bind pose reconstructed."
 
 
+@functools.lru_cache(maxsize=None)
+def _layer_element_enums(fbx_module) -> Tuple[Any, Any]:  # type: ignore[valid-type]
+    """Resolve the ``(eNone, eDirect)`` layer-element enums once per module."""
+
+    layer_element = getattr(fbx_module, "FbxLayerElement", None)
+    return (
+        getattr(layer_element, "eNone", None),
+        getattr(layer_element, "eDirect", None),
+    )
+
+
+def _collect_skin_clusters(
+    mesh_nodes: List[Tuple[Any, Any, str]], fbx_module
+) -> List[Tuple[Any, str, Any, Any]]:  # type: ignore[valid-type]
+    """Flatten every skinned mesh into ``(node, path, skin, cluster)`` rows.
+
+    One sweep serves both the metrics cluster count and the repair pass,
+    instead of each re-enumerating the same deformer/cluster nest.
+    """
+
+    out: List[Tuple[Any, str, Any, Any]] = []
+    append = out.append
+    for node, mesh, path in mesh_nodes:
+        for skin in _iter_skin_deformers(mesh, fbx_module):
+            if skin is None:
+                continue
+            get_cluster = skin.GetCluster
+            for index in range(skin.GetClusterCount()):
+                cluster = get_cluster(index)
+                if cluster is not None:
+                    append((node, path, skin, cluster))
+    return out
+
+
+def _count_scene_objects(scene, fbx_module) -> Optional[Tuple[int, int, int, int]]:  # type: ignore[valid-type]
+    """Tally materials, textures, anim stacks and anim curves in one scan.
+
+    Each criteria-based GetSrcObjectCount query walks the scene's whole
+    source-object table; enumerating it once and classifying by ClassId
+    replaces four walks with one. Returns ``None`` when the untyped
+    enumeration API is unavailable so callers can fall back to criteria
+    queries.
+    """
+
+    class_ids = []
+    for class_name in ("FbxSurfaceMaterial", "FbxTexture", "FbxAnimStack", "FbxAnimCurve"):
+        class_id = getattr(getattr(fbx_module, class_name, None), "ClassId", None)
+        if class_id is None:
+            return None
+        class_ids.append(class_id)
+
+    try:
+        total = int(scene.GetSrcObjectCount())
+    except TypeError:
+        return None
+
+    counts = [0, 0, 0, 0]
+    get_object = scene.GetSrcObject
+    try:
+        for index in range(total):
+            obj = get_object(index)
+            if obj is None:
+                continue
+            obj_class = obj.GetClassId()
+            for slot, class_id in enumerate(class_ids):
+                if obj_class.Is(class_id):
+                    counts[slot] += 1
+                    break
+    except (TypeError, AttributeError):  # pragma: no cover - binding variations
+        return None
+    return (counts[0], counts[1], counts[2], counts[3])
+
+
+@functools.lru_cache(maxsize=None)
+def _metrics_criteria(fbx_module) -> Tuple[Any, Any, Any, Any]:  # type: ignore[valid-type]
+    """Build the object-type criteria used by metrics collection once.
+
+    Returns ``(material, texture, anim_stack, anim_curve)`` filters; each
+    construction crosses the SDK boundary, so they are cached per module.
+    """
+
+    object_type = fbx_module.FbxCriteria.ObjectType
+    return (
+        object_type(fbx_module.FbxSurfaceMaterial.ClassId),
+        object_type(fbx_module.FbxTexture.ClassId),
+        object_type(fbx_module.FbxAnimStack.ClassId),
+        object_type(fbx_module.FbxAnimCurve.ClassId),
+    )
+
+
 # ---------------------------------------------------------------------------
 # Metrics helpers
 
 
-def collect_scene_metrics(scene, fbx_module, mesh_metrics: Dict[str, MeshMetrics]) -> SceneMetrics:  # type: ignore[valid-type]
+def collect_scene_metrics(
+    scene,
+    fbx_module,
+    mesh_metrics: Dict[str, MeshMetrics],
+    nodes: Optional[List[Any]] = None,
+    mesh_attrs: Optional[List[Any]] = None,
+    skin_clusters: Optional[List[Tuple[Any, str, Any, Any]]] = None,
+) -> SceneMetrics:  # type: ignore[valid-type]
+    """Gather scene-wide counts.
+
+    ``nodes`` lets callers that already walked the hierarchy (e.g. the
+    validator) share their flat node list, ``mesh_attrs`` the mesh
+    attributes they already filtered, and ``skin_clusters`` the flattened
+    cluster rows from :func:`_collect_skin_clusters`, which makes the
+    cluster count a plain ``len``.
+    """
+
     metrics = SceneMetrics()
     root = scene.GetRootNode()
     if root is None:
         return metrics
 
-    def iter_nodes(node):
-        yield node
-        for idx in range(node.GetChildCount()):
-            yield from iter_nodes(node.GetChild(idx))
-
-    nodes = list(iter_nodes(root))
+    if nodes is None:
+        nodes = list(iter_nodes(root))
     metrics.node_count = len(nodes)
 
     metrics.mesh_metrics = dict(mesh_metrics)
 
-    criteria_material = fbx_module.FbxCriteria.ObjectType(fbx_module.FbxSurfaceMaterial.ClassId)
-    metrics.material_count = scene.GetSrcObjectCount(criteria_material)
-
-    criteria_texture = fbx_module.FbxCriteria.ObjectType(fbx_module.FbxTexture.ClassId)
-    metrics.texture_count = scene.GetSrcObjectCount(criteria_texture)
-
-    metrics.skin_cluster_count = 0
-    for node in nodes:
-        attr = node.GetNodeAttribute()
-        if isinstance(attr, fbx_module.FbxMesh):
+    object_counts = _count_scene_objects(scene, fbx_module)
+    if object_counts is not None:
+        (
+            metrics.material_count,
+            metrics.texture_count,
+            metrics.anim_stack_count,
+            metrics.anim_curve_count,
+        ) = object_counts
+    else:  # pragma: no cover - fallback for bindings without untyped scans
+        criteria_material, criteria_texture, criteria_anim_stack, criteria_anim_curve = (
+            _metrics_criteria(fbx_module)
+        )
+        metrics.material_count = scene.GetSrcObjectCount(criteria_material)
+        metrics.texture_count = scene.GetSrcObjectCount(criteria_texture)
+        metrics.anim_stack_count = scene.GetSrcObjectCount(criteria_anim_stack)
+        metrics.anim_curve_count = scene.GetSrcObjectCount(criteria_anim_curve)
+
+    if skin_clusters is not None:
+        metrics.skin_cluster_count = len(skin_clusters)
+    else:
+        if mesh_attrs is None:
+            mesh_class = fbx_module.FbxMesh
+            mesh_attrs = [
+                attr
+                for attr in (node.GetNodeAttribute() for node in nodes)
+                if isinstance(attr, mesh_class)
+            ]
+        metrics.skin_cluster_count = 0
+        for attr in mesh_attrs:
             for skin in _iter_skin_deformers(attr, fbx_module):
                 if skin is not None:
                     metrics.skin_cluster_count += skin.GetClusterCount()
 
     metrics.bind_pose_count = sum(1 for idx in range(scene.GetPoseCount()) if scene.GetPose(idx).IsBindPose())
 
-    criteria_anim_stack = fbx_module.FbxCriteria.ObjectType(fbx_module.FbxAnimStack.ClassId)
-    metrics.anim_stack_count = scene.GetSrcObjectCount(criteria_anim_stack)
-
-    criteria_anim_curve = fbx_module.FbxCriteria.ObjectType(fbx_module.FbxAnimCurve.ClassId)
-    metrics.anim_curve_count = scene.GetSrcObjectCount(criteria_anim_curve)
-
     return metrics
 
 
@@ -1126,22 +1540,74 @@ def round_trip_check(
     *,
     canonical_settings: Optional[CanonicalSettings] = None,
     baseline_metrics: Optional[SceneMetrics] = None,
+    validate_full: bool = True,
 ) -> RoundTripDiffReport:
-    manager = sdk.create_manager()
+    """Reload an exported file and audit it.
+
+    With ``validate_full=False`` and no baseline to diff against, only scene
+    metrics are collected and the per-category validators are skipped — the
+    cheap mode for pipelines that just want counts. A provided baseline
+    forces the full pass, since mesh-level metrics come from the geometry
+    validator.
+    """
+
+    manager = sdk.acquire_manager()
+    scene = None
     try:
-        sdk.create_io_settings(manager)
         scene = sdk.create_scene(manager)
         if not sdk.load_scene(manager, scene, export_path):
             raise RuntimeError(f"Failed to reload exported FBX '{export_path}' for validation")
 
-        validator = SceneValidator(scene, canonical_settings=canonical_settings)
-        validation_report = validator.validate()
+        if validate_full or baseline_metrics is not None:
+            validator = SceneValidator(scene, canonical_settings=canonical_settings)
+            validation_report = validator.validate()
+        else:
+            fbx_module, _ = sdk.import_fbx_module()
+            validation_report = ValidationReport()
+            validation_report.metrics = collect_scene_metrics(scene, fbx_module, {})
         metrics_diff = []
         if baseline_metrics is not None:
             metrics_diff = validation_report.metrics.diff(baseline_metrics)
         return RoundTripDiffReport(validation=validation_report, metrics_diff=metrics_diff)
     finally:
-        sdk.destroy_manager(manager)
+        if scene is not None:
+            scene.Destroy()
+        sdk.release_manager(manager)
+
+
+def _round_trip_check_task(args: Tuple[str, bool]) -> RoundTripDiffReport:
+    """Module-level worker for :func:`round_trip_check_many` (picklable)."""
+
+    export_path, validate_full = args
+    return round_trip_check(export_path, validate_full=validate_full)
+
+
+def round_trip_check_many(
+    export_paths: Sequence[str],
+    *,
+    validate_full: bool = True,
+    max_workers: Optional[int] = None,
+) -> List[RoundTripDiffReport]:
+    """Run :func:`round_trip_check` over many exports in parallel.
+
+    Worker processes are used rather than threads because the FBX SDK is
+    not thread-safe; each process builds its own manager pool and default
+    canonical settings. Reports come back in the order the paths were
+    given. Canonical settings and baselines hold SDK objects that cannot
+    cross process boundaries, so per-path baselines are not supported here.
+    """
+
+    if not export_paths:
+        return []
+    if len(export_paths) == 1:
+        return [round_trip_check(export_paths[0], validate_full=validate_full)]
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(
+            executor.map(
+                _round_trip_check_task,
+                [(path, validate_full) for path in export_paths],
+            )
+        )
 
 
 # ---------------------------------------------------------------------------
@@ -1149,21 +1615,32 @@ def round_trip_check(
 
 
 def _validate_layer_element(
-    report: ValidationCategoryReport, element, label: str, object_path: str, fbx_module
+    report: ValidationCategoryReport,
+    element,
+    label: str,
+    object_path: str,
+    fbx_module,
+    direct_count: Optional[int] = None,
 ) -> None:  # type: ignore[valid-type]
+    """Check one layer element; ``direct_count`` lets callers that already
+    read the direct array size skip a second SDK round trip."""
+
     mapping_mode = element.GetMappingMode()
     reference_mode = element.GetReferenceMode()
-    direct = element.GetDirectArray() if hasattr(element, "GetDirectArray") else None
     index = element.GetIndexArray() if hasattr(element, "GetIndexArray") else None
+    mapping_none, reference_direct = _layer_element_enums(fbx_module)
 
-    if direct is not None and direct.GetCount() == 0:
+    if direct_count is None:
+        direct = element.GetDirectArray() if hasattr(element, "GetDirectArray") else None
+        if direct is not None:
+            direct_count = direct.GetCount()
+    if direct_count == 0:
         report.add_issue(
             "WARN",
             f"Layer element {label} has no direct data.",
             code=f"geometry.layer.{label}.empty",
             object_path=object_path,
         )
-    mapping_none = getattr(fbx_module.FbxLayerElement, "eNone", None)
     if mapping_none is not None and mapping_mode == mapping_none:  # pragma: no cover - defensive
         report.add_issue(
             "FAIL",
@@ -1171,7 +1648,6 @@ def _validate_layer_element(
             code=f"geometry.layer.{label}.mapping",
             object_path=object_path,
         )
-    reference_direct = getattr(fbx_module.FbxLayerElement, "eDirect", None)
     if (
         index is not None
         and index.GetCount() == 0
@@ -1186,23 +1662,32 @@ def _validate_layer_element(
         )
 
 
+@functools.lru_cache(maxsize=None)
+def _texture_channels(fbx_module) -> Tuple[Tuple[str, str], ...]:  # type: ignore[valid-type]
+    """Resolve the ``(label, property name)`` texture channels once per module.
+
+    Only Diffuse maps through an SDK constant; the remaining channels are
+    looked up by their literal property names.
+    """
+
+    diffuse = getattr(getattr(fbx_module, "FbxSurfaceMaterial", None), "sDiffuse", "Diffuse")
+    return (
+        ("Diffuse", diffuse),
+        ("Specular", "Specular"),
+        ("NormalMap", "NormalMap"),
+        ("Bump", "Bump"),
+        ("Emissive", "Emissive"),
+        ("BaseColor", "BaseColor"),
+    )
+
+
 def _validate_material_textures(report: ValidationCategoryReport, material, node_path: str, fbx_module) -> None:  # type: ignore[valid-type]
-    texture_channel_names = [
-        "Diffuse",
-        "Specular",
-        "NormalMap",
-        "Bump",
-        "Emissive",
-        "BaseColor",
-    ]
-    for channel in texture_channel_names:
-        property_handle = material.FindProperty(
-            fbx_module.FbxSurfaceMaterial.sDiffuse if channel == "Diffuse" else channel
-        )
+    class_id = getattr(getattr(fbx_module, "FbxTexture", None), "ClassId", None)
+    for channel, property_name in _texture_channels(fbx_module):
+        property_handle = material.FindProperty(property_name)
         if not property_handle.IsValid():
             continue
 
-        class_id = getattr(getattr(fbx_module, "FbxTexture", None), "ClassId", None)
         texture_getter = None
         texture_count = 0
 
@@ -1250,41 +1735,55 @@ def _validate_material_textures(report: ValidationCategoryReport, material, node
             )
 
 
-def _node_path(node) -> str:  # type: ignore[valid-type]
-    names: List[str] = []
-    current = node
-    while current is not None:
-        names.append(current.GetName() or "<unnamed>")
-        current = current.GetParent()
-    return "/" + "/".join(reversed(names))
-
-
-def _find_node_by_path(root, path: str):  # type: ignore[valid-type]
-    target = path.split("/")
-    target = [segment for segment in target if segment]
-    if not target:
-        return root
-
-    def match(node, segments):
-        if not segments:
-            return node
-        name = segments[0]
-        if (node.GetName() or "") != name:
-            return None
-        if len(segments) == 1:
-            return node
-        for idx in range(node.GetChildCount()):
-            child = node.GetChild(idx)
-            result = match(child, segments[1:])
-            if result is not None:
-                return result
-        return None
-
-    for idx in range(root.GetChildCount()):
-        child = root.GetChild(idx)
-        result = match(child, target)
-        if result is not None:
-            return result
-    return None
+def _collect_nodes_with_paths(root) -> List[Tuple[Any, str]]:  # type: ignore[valid-type]
+    """Flatten the scene into ``(node, path)`` pairs with one iterative walk.
+
+    Paths are extended incrementally from the parent's path, so the walk does
+    one ``GetName`` per node instead of an O(depth) parent-chain climb.
+    """
+
+    out: List[Tuple[Any, str]] = []
+    append = out.append
+    stack = [(root, "/" + (root.GetName() or "<unnamed>"))]
+    pop = stack.pop
+    push = stack.extend
+    while stack:
+        node, path = pop()
+        append((node, path))
+        count = node.GetChildCount()
+        if count:
+            get_child = node.GetChild
+            prefix = path + "/"
+            push(
+                [
+                    (child, prefix + (child.GetName() or "<unnamed>"))
+                    for child in (get_child(idx) for idx in range(count))
+                ]
+            )
+    return out
+
+
+def _collect_mesh_nodes(
+    nodes: List[Tuple[Any, str]], fbx_module
+) -> List[Tuple[Any, Any, str]]:  # type: ignore[valid-type]
+    """Filter ``(node, path)`` pairs down to ``(node, mesh, path)`` triples."""
+
+    mesh_nodes: List[Tuple[Any, Any, str]] = []
+    append = mesh_nodes.append
+    # Enum compare beats isinstance against a SWIG-wrapped class (an MRO
+    # walk per node); fall back to isinstance if the enum is unavailable.
+    mesh_enum = getattr(getattr(fbx_module, "FbxNodeAttribute", None), "eMesh", None)
+    if mesh_enum is not None:
+        for node, path in nodes:
+            attr = node.GetNodeAttribute()
+            if attr is not None and attr.GetAttributeType() == mesh_enum:
+                append((node, attr, path))
+    else:  # pragma: no cover - defensive for unusual bindings
+        mesh_class = fbx_module.FbxMesh
+        for node, path in nodes:
+            attr = node.GetNodeAttribute()
+            if attr is not None and isinstance(attr, mesh_class):
+                append((node, attr, path))
+    return mesh_nodes
 
 
@@ -2,15 +2,16 @@
 
 from __future__ import annotations
 
+import functools
 import json
-from dataclasses import asdict
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
-from typing import Any, Dict, Iterable, List, Optional, Tuple, cast
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, cast
 
 from ..core import FBXAnalyzer
-from ..core.exceptions import FBXLoadError, FBXSDKNotAvailableError, FBXSaveError
 from ..core.save_as import (
     SceneExportDiagnostics,
     rebuild_scene_graph_as,
@@ -40,6 +41,14 @@ DEFAULT_ATTRIBUTE_OPTIONS: Tuple[str, ...] = (
     "Effector",
 )
 
+# Tag marking the dummy row that stands in for an unexpanded branch's
+# children in the lazy Treeview population scheme.
+_TREE_PLACEHOLDER_TAG = "placeholder"
+
+# Ceiling for parse/save worker processes; each worker loads its own copy
+# of the FBX SDK, so memory grows with the pool.
+_MAX_IMPORT_WORKERS = 4
+
 
 class DocumentPane:
     """Render a single FBX analysis inside a notebook tab."""
@@ -53,8 +62,30 @@ class DocumentPane:
 
         self._joint_map: Dict[str, Joint] = {}
         self._node_map: Dict[str, SceneNode] = {}
+        # Reverse of _node_map: id(node) -> Treeview iid for materialized rows,
+        # letting edit handlers patch rows in place instead of rebuilding.
+        self._iid_by_id: Dict[int, str] = {}
+        # id(node) -> parent for every node in the scene graph, rebuilt by
+        # _rebuild_parent_links. Keyed by identity rather than uid because
+        # nodes added in the editor have no uid until export.
+        self._parent_by_id: Dict[int, Optional[SceneNode]] = {}
         self._reparent_target: Optional[SceneNode] = None
         self._attribute_options = list(DEFAULT_ATTRIBUTE_OPTIONS)
+        # Selection handlers coalesce bursts (arrow-key auto-repeat) into one
+        # idle-time refresh; the last shown values let unchanged labels skip
+        # their Tk round-trip.
+        self._node_select_pending = False
+        self._joint_select_pending = False
+        self._last_node_detail: Dict[str, str] = {}
+        self._last_joint_detail: Dict[str, str] = {}
+        # Rendered User Properties text per node. Properties are read-only
+        # in the editor, so entries never invalidate; the node reference in
+        # the value pins it against id() reuse.
+        self._properties_text_cache: Dict[int, Tuple[SceneNode, str]] = {}
+        # Bumped on every scene-graph edit. Save As snapshots it at submit
+        # time so a completed save only clears the dirty flag when no edits
+        # landed while the worker was running.
+        self.edit_generation = 0
 
         self.metadata: SceneMetadata = document.metadata or SceneMetadata()
         self._object_metadata: Dict[int, SceneObjectInfo] = {obj.uid: obj for obj in self.metadata.objects}
@@ -84,6 +115,7 @@ class DocumentPane:
 
         notebook = ttk.Notebook(self.frame)
         notebook.pack(fill=tk.BOTH, expand=True)
+        self._tab_notebook = notebook
 
         scene_frame = ttk.Frame(notebook)
         notebook.add(scene_frame, text="Scene Nodes")
@@ -91,11 +123,24 @@ class DocumentPane:
 
         skeleton_frame = ttk.Frame(notebook)
         notebook.add(skeleton_frame, text="Skeleton")
-        self._build_skeleton_tab(skeleton_frame)
 
         metadata_frame = ttk.Frame(notebook)
         notebook.add(metadata_frame, text="Metadata")
-        self._build_metadata_tab(metadata_frame)
+
+        # The Scene Nodes tab is the landing view and builds eagerly; the
+        # other tabs populate on first visit, since most tabs in a
+        # multi-file session are never opened.
+        self._tab_builders: Dict[str, Callable[[], None]] = {
+            str(skeleton_frame): lambda: self._build_skeleton_tab(skeleton_frame),
+            str(metadata_frame): lambda: self._build_metadata_tab(metadata_frame),
+        }
+        notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+
+    def _on_tab_changed(self, _event) -> None:
+        tab_id = self._tab_notebook.select()
+        builder = self._tab_builders.pop(tab_id, None)
+        if builder is not None:
+            builder()
 
     # ------------------------------------------------------------------
     # Skeleton tab
@@ -188,6 +233,7 @@ class DocumentPane:
             )
 
         self.joint_tree.bind("<<TreeviewSelect>>", self._on_joint_select)
+        self.joint_tree.bind("<<TreeviewOpen>>", self._on_joint_tree_open)
         self._populate_joint_tree(skeletons)
 
     def _populate_joint_tree(self, skeletons: List[Skeleton]) -> None:
@@ -198,21 +244,49 @@ class DocumentPane:
                 first_item = root_id
             self._joint_map[root_id] = skeleton.root
             self.joint_tree.item(root_id, open=True)
-            self._insert_joint(root_id, skeleton.root)
+            self._insert_joint_stub(root_id, skeleton.root)
 
         if first_item:
             self.joint_tree.selection_set(first_item)
             self._on_joint_select(None)
 
-    def _insert_joint(self, parent_id: str, joint: Joint) -> None:
+    def _insert_joint_stub(self, parent_id: str, joint: Joint) -> str:
+        """Insert ``joint`` with a placeholder standing in for its children."""
+
         node_id = self.joint_tree.insert(parent_id, tk.END, text=joint.name, values=(joint.joint_type,))
         self._joint_map[node_id] = joint
+        if joint.children:
+            self.joint_tree.insert(node_id, tk.END, tags=(_TREE_PLACEHOLDER_TAG,))
+        return node_id
+
+    def _materialize_joint_children(self, iid: str) -> None:
+        """Swap a placeholder row for the joint's real children."""
+
+        children = self.joint_tree.get_children(iid)
+        if not children or _TREE_PLACEHOLDER_TAG not in self.joint_tree.item(children[0], "tags"):
+            return
+        self.joint_tree.delete(children[0])
+        joint = self._joint_map.get(iid)
+        if joint is None:
+            return
         for child in joint.children:
-            self._insert_joint(node_id, child)
+            self._insert_joint_stub(iid, child)
+
+    def _on_joint_tree_open(self, _event) -> None:
+        iid = self.joint_tree.focus()
+        if iid:
+            self._materialize_joint_children(iid)
 
     def _on_joint_select(self, _event) -> None:
         if not hasattr(self, "joint_tree"):
             return
+        if self._joint_select_pending:
+            return
+        self._joint_select_pending = True
+        self.frame.after_idle(self._do_joint_select)
+
+    def _do_joint_select(self) -> None:
+        self._joint_select_pending = False
         selection = self.joint_tree.selection()
         if not selection:
             return
@@ -220,12 +294,19 @@ class DocumentPane:
         if joint is None:
             return
 
-        self.joint_detail_vars["name"].set(joint.name)
-        self.joint_detail_vars["type"].set(joint.joint_type)
-        self.joint_detail_vars["parent"].set(joint.parent_name or "-")
-        self.joint_detail_vars["translation"].set(_vector_to_string(joint.transform.translation))
-        self.joint_detail_vars["rotation"].set(_vector_to_string(joint.transform.rotation))
-        self.joint_detail_vars["scaling"].set(_vector_to_string(joint.transform.scaling))
+        details = {
+            "name": joint.name,
+            "type": joint.joint_type,
+            "parent": joint.parent_name or "-",
+            "translation": _vector_to_string(joint.transform.translation),
+            "rotation": _vector_to_string(joint.transform.rotation),
+            "scaling": _vector_to_string(joint.transform.scaling),
+        }
+        last = self._last_joint_detail
+        for key, value in details.items():
+            if last.get(key) != value:
+                self.joint_detail_vars[key].set(value)
+        self._last_joint_detail = details
 
     # ------------------------------------------------------------------
     # Scene nodes tab
@@ -309,6 +390,9 @@ class DocumentPane:
         scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=self.node_tree.yview)
         self.node_tree.configure(yscrollcommand=scrollbar.set)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        # Kept for re-packing the tree in its original order after bulk
+        # rebuilds temporarily unmap it.
+        self._node_tree_scrollbar = scrollbar
 
         detail_title = ttk.Label(detail_frame, text="Node Details", font=("Helvetica", 14, "bold"))
         detail_title.pack(anchor=tk.W)
@@ -322,7 +406,7 @@ class DocumentPane:
             "rotation": tk.StringVar(value=""),
             "scaling": tk.StringVar(value=""),
         }
-        self.node_properties_var = tk.StringVar(value="")
+        self._last_properties_text = ""
 
         detail_rows = ttk.Frame(detail_frame)
         detail_rows.pack(fill=tk.BOTH, expand=True, pady=(8, 0))
@@ -339,13 +423,20 @@ class DocumentPane:
         properties_row = len(self.node_detail_vars)
         properties_label = ttk.Label(detail_rows, text="User Properties:")
         properties_label.grid(row=properties_row, column=0, sticky=tk.W, pady=(12, 3))
-        ttk.Label(
+        # A read-only Text handles multi-line payloads without the per-set
+        # re-wrap a StringVar-backed label pays.
+        self.node_properties_text = tk.Text(
             detail_rows,
-            textvariable=self.node_properties_var,
+            height=6,
+            width=52,
+            wrap=tk.WORD,
+            relief=tk.FLAT,
+            borderwidth=0,
+            highlightthickness=0,
             font=("Helvetica", 10),
-            wraplength=420,
-            justify=tk.LEFT,
-        ).grid(row=properties_row + 1, column=0, sticky=tk.W)
+        )
+        self.node_properties_text.grid(row=properties_row + 1, column=0, sticky=tk.W)
+        self._set_node_properties_text("<none>")
 
         edit_row = properties_row + 2
         edit_frame = ttk.LabelFrame(detail_rows, text="Edit Node", padding=8)
@@ -489,6 +580,7 @@ class DocumentPane:
         connection_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
         self.node_tree.bind("<<TreeviewSelect>>", self._on_node_select)
+        self.node_tree.bind("<<TreeviewOpen>>", self._on_node_tree_open)
         self._render_scene_tree(scene_graph, focus_uid=None, focus_node=None)
 
     def _build_metadata_tab(self, container: ttk.Frame) -> None:
@@ -708,28 +800,53 @@ class DocumentPane:
     def _on_node_select(self, _event) -> None:
         if not hasattr(self, "node_tree"):
             return
+        if self._node_select_pending:
+            return
+        self._node_select_pending = True
+        self.frame.after_idle(self._do_node_select)
+
+    def _do_node_select(self) -> None:
+        self._node_select_pending = False
         node = self._get_selected_scene_node()
         if node is None:
             return
 
-        self.node_detail_vars["name"].set(node.name)
-        self.node_detail_vars["attribute_type"].set(node.attribute_type)
-        self.node_detail_vars["attribute_class"].set(node.attribute_class)
-        self.node_detail_vars["child_count"].set(str(node.child_count))
-        self.node_detail_vars["translation"].set(_vector_to_string(node.translation))
-        self.node_detail_vars["rotation"].set(_vector_to_string(node.rotation))
-        self.node_detail_vars["scaling"].set(_vector_to_string(node.scaling))
+        translation = _vector_to_string(node.translation)
+        rotation = _vector_to_string(node.rotation)
+        scaling = _vector_to_string(node.scaling)
+        details = {
+            "name": node.name,
+            "attribute_type": node.attribute_type,
+            "attribute_class": node.attribute_class,
+            "child_count": str(node.child_count),
+            "translation": translation,
+            "rotation": rotation,
+            "scaling": scaling,
+        }
+        last = self._last_node_detail
+        for key, value in details.items():
+            if last.get(key) != value:
+                self.node_detail_vars[key].set(value)
+        self._last_node_detail = details
 
         self._node_name_edit.set(node.name)
-        self._translation_edit.set(_vector_to_string(node.translation))
-        self._rotation_edit.set(_vector_to_string(node.rotation))
-        self._scaling_edit.set(_vector_to_string(node.scaling))
-
-        if node.properties:
-            lines = [f"{key}: {value}" for key, value in node.properties.items()]
-            self.node_properties_var.set("\n".join(lines))
+        self._translation_edit.set(translation)
+        self._rotation_edit.set(rotation)
+        self._scaling_edit.set(scaling)
+
+        cache = self._properties_text_cache
+        entry = cache.get(id(node))
+        if entry is not None and entry[0] is node:
+            properties_text = entry[1]
         else:
-            self.node_properties_var.set("<none>")
+            if node.properties:
+                properties_text = "\n".join(
+                    f"{key}: {value}" for key, value in node.properties.items()
+                )
+            else:
+                properties_text = "<none>"
+            cache[id(node)] = (node, properties_text)
+        self._set_node_properties_text(properties_text)
 
         if node.attribute_type and node.attribute_type not in self._attribute_options:
             self._attribute_options.append(node.attribute_type)
@@ -774,7 +891,8 @@ class DocumentPane:
             self._reparent_target_var.set(new_name)
 
         self.node_detail_vars["name"].set(new_name)
-        self._refresh_scene_tree(focus_uid=node.uid)
+        self._update_node_row(node)
+        self._update_document_top_level()
         self._set_node_status(f"Renamed node to {new_name}.")
 
     def _apply_attribute_change(self) -> None:
@@ -790,7 +908,9 @@ class DocumentPane:
         if node.attribute_class == "(NoAttribute)" and new_type in self._attribute_options:
             node.attribute_class = "Skeleton"
         self._mark_scene_graph_dirty()
-        self._refresh_scene_tree(focus_uid=node.uid)
+        self._update_node_row(node)
+        self._update_document_top_level()
+        self._on_node_select(None)
         self._set_node_status(f"Updated attribute to {new_type}.")
 
     def _derive_attribute_class(self, attribute_type: str) -> str:
@@ -839,7 +959,8 @@ class DocumentPane:
         self.node_detail_vars[attribute].set(_vector_to_string(vector))
         var.set(_vector_to_string(vector))
 
-        self._refresh_scene_tree(focus_uid=node.uid)
+        # Transforms appear only in the detail pane, so the tree and the
+        # top-level summary need no update.
         self._set_node_status(f"Updated {label.lower()} for {node.name}.")
 
     def _add_child_node(self) -> None:
@@ -873,10 +994,23 @@ class DocumentPane:
             properties={},
         )
         parent.children.append(new_node)
+        parent.child_count = len(parent.children)
+        self._parent_by_id[id(new_node)] = parent
         self._mark_scene_graph_dirty()
 
         self._new_node_name.set("")
-        self._refresh_scene_tree(focus_node=new_node)
+        parent_iid = self._iid_by_id.get(id(parent))
+        if parent_iid is not None:
+            # Materializing first keeps a collapsed branch consistent: the
+            # placeholder swap already includes the new child.
+            self._materialize_node_children(parent_iid)
+            if self._iid_by_id.get(id(new_node)) is None:
+                self._insert_node_stub(parent_iid, new_node)
+            self.node_tree.item(parent_iid, open=True)
+        self._update_node_row(parent)
+        self._update_document_top_level()
+        self._focus_node_row(new_node)
+        self._on_node_select(None)
         self._set_node_status(f"Added {new_node.name} under {parent.name}.")
 
     def _mark_reparent_target(self) -> None:
@@ -903,14 +1037,24 @@ class DocumentPane:
         if self._is_descendant(node, target):
             self._set_node_status("Cannot reparent to a descendant; that would create a cycle.")
             return
-        parent = self._find_parent(self.document.scene_graph, node)
+        parent = self._find_parent(node)
         if parent is None:
             self._set_node_status("Cannot reparent the root node.")
             return
-        parent.children.remove(node)
+        _remove_child(parent, node)
         target.children.append(node)
+        parent.child_count = len(parent.children)
+        target.child_count = len(target.children)
+        node.parent_uid = target.uid
+        self._parent_by_id[id(node)] = target
         self._mark_scene_graph_dirty()
-        self._refresh_scene_tree(focus_uid=node.uid)
+
+        self._move_node_rows(node, target)
+        self._update_node_row(parent)
+        self._update_node_row(target)
+        self._update_document_top_level()
+        self._focus_node_row(node)
+        self._on_node_select(None)
         self._set_node_status(f"Moved {node.name} under {target.name}.")
 
     def _promote_selected(self) -> None:
@@ -918,18 +1062,28 @@ class DocumentPane:
         if node is None:
             self._set_node_status("Select a node to promote.")
             return
-        parent = self._find_parent(self.document.scene_graph, node)
+        parent = self._find_parent(node)
         if parent is None:
             self._set_node_status("Selected node is already the root.")
             return
-        grandparent = self._find_parent(self.document.scene_graph, parent)
+        grandparent = self._find_parent(parent)
         if grandparent is None:
             self._set_node_status("Use 'Remove Node' to replace the root instead.")
             return
-        parent.children.remove(node)
+        _remove_child(parent, node)
         grandparent.children.append(node)
+        parent.child_count = len(parent.children)
+        grandparent.child_count = len(grandparent.children)
+        node.parent_uid = grandparent.uid
+        self._parent_by_id[id(node)] = grandparent
         self._mark_scene_graph_dirty()
-        self._refresh_scene_tree(focus_uid=node.uid)
+
+        self._move_node_rows(node, grandparent)
+        self._update_node_row(parent)
+        self._update_node_row(grandparent)
+        self._update_document_top_level()
+        self._focus_node_row(node)
+        self._on_node_select(None)
         self._set_node_status(f"Promoted {node.name} to be a child of {grandparent.name}.")
 
     def _remove_node_promote_children(self) -> None:
@@ -937,10 +1091,11 @@ class DocumentPane:
         if node is None:
             self._set_node_status("Select a node to remove.")
             return
-        root = self.document.scene_graph
-        parent = self._find_parent(root, node)
-        focus_uid: Optional[int] = None
+        parent = self._find_parent(node)
         if parent is None:
+            # Replacing the root swaps the whole hierarchy; this is the one
+            # edit that still warrants a full rebuild.
+            focus_uid: Optional[int] = None
             if not node.children:
                 self.document.scene_graph = None
                 self._set_node_status(f"Removed root node {node.name}; scene is now empty.")
@@ -952,70 +1107,106 @@ class DocumentPane:
                 focus_uid = new_root.uid
                 self._set_node_status(f"Removed root {node.name}; promoted {new_root.name} to root.")
             self._reset_reparent_target()
-        else:
-            parent.children.remove(node)
-            parent.children.extend(node.children)
-            focus_uid = parent.uid
-            self._set_node_status(
-                f"Removed {node.name}; promoted its children under {parent.name}."
-            )
+            self._mark_scene_graph_dirty()
+            self._refresh_scene_tree(focus_uid=focus_uid)
+            return
 
+        _remove_child(parent, node)
+        parent.children.extend(node.children)
+        for child in node.children:
+            child.parent_uid = parent.uid
+            self._parent_by_id[id(child)] = parent
+        parent.child_count = len(parent.children)
+        self._parent_by_id.pop(id(node), None)
         self._mark_scene_graph_dirty()
         if self._reparent_target is node:
             self._reset_reparent_target()
 
-        self._refresh_scene_tree(focus_uid=focus_uid)
+        node_iid = self._iid_by_id.get(id(node))
+        if node_iid is not None:
+            # A materialized victim implies a materialized parent row.
+            parent_iid = self._iid_by_id[id(parent)]
+            if self._branch_materialized(node_iid):
+                for child in node.children:
+                    child_iid = self._iid_by_id.get(id(child))
+                    if child_iid is not None:
+                        self.node_tree.move(child_iid, parent_iid, tk.END)
+                self._delete_branch_rows(node_iid)
+            else:
+                self._delete_branch_rows(node_iid)
+                for child in node.children:
+                    self._insert_node_stub(parent_iid, child)
+        self._update_node_row(parent)
+        self._update_document_top_level()
+        self._focus_node_row(parent)
+        self._on_node_select(None)
+        self._set_node_status(
+            f"Removed {node.name}; promoted its children under {parent.name}."
+        )
 
-    def _find_parent(self, current: Optional[SceneNode], target: SceneNode) -> Optional[SceneNode]:
-        if current is None or current is target:
-            return None
-        for child in current.children:
-            if child is target:
-                return current
-            result = self._find_parent(child, target)
-            if result is not None:
-                return result
-        return None
+    def _find_parent(self, node: SceneNode) -> Optional[SceneNode]:
+        return self._parent_by_id.get(id(node))
 
     def _is_descendant(self, ancestor: SceneNode, candidate: SceneNode) -> bool:
-        if ancestor is candidate:
-            return True
-        for child in ancestor.children:
-            if self._is_descendant(child, candidate):
+        """Walk up the cached parent links instead of scanning the subtree."""
+
+        current: Optional[SceneNode] = candidate
+        while current is not None:
+            if current is ancestor:
                 return True
+            current = self._parent_by_id.get(id(current))
         return False
 
     def _node_exists(self, node: SceneNode) -> bool:
-        root = self.document.scene_graph
-        return root is not None and self._is_descendant(root, node)
+        return id(node) in self._parent_by_id
 
     def _rebuild_parent_links(self, node: SceneNode, parent: Optional[SceneNode] = None) -> None:
-        node.parent_uid = parent.uid if parent else None
-        for child in node.children:
-            self._rebuild_parent_links(child, node)
+        parent_by_id = self._parent_by_id
+        stack: List[Tuple[SceneNode, Optional[SceneNode]]] = [(node, parent)]
+        pop = stack.pop
+        while stack:
+            current, current_parent = pop()
+            current.parent_uid = current_parent.uid if current_parent else None
+            parent_by_id[id(current)] = current_parent
+            for child in current.children:
+                stack.append((child, current))
 
     def _recompute_child_counts(self, node: SceneNode) -> int:
-        node.child_count = len(node.children)
-        for child in node.children:
-            self._recompute_child_counts(child)
+        stack = [node]
+        pop = stack.pop
+        while stack:
+            current = pop()
+            current.child_count = len(current.children)
+            stack.extend(current.children)
         return node.child_count
 
     def _update_document_top_level(self) -> None:
         root = self.document.scene_graph
-        top_level: List[Dict[str, Any]] = []
-        if root:
-            for child in root.children:
-                top_level.append(
-                    {
-                        "name": child.name,
-                        "attribute_type": child.attribute_type,
-                        "attribute_class": child.attribute_class,
-                        "child_count": child.child_count,
-                        "is_mesh": "mesh" in child.attribute_type.lower()
-                        or (child.attribute_class or "").lower().endswith("mesh"),
-                    }
-                )
-        self.document.top_level_nodes = top_level
+        if root is None:
+            self.document.top_level_nodes = []
+            return
+        self.document.top_level_nodes = [
+            {
+                "name": child.name,
+                "attribute_type": child.attribute_type,
+                "attribute_class": child.attribute_class,
+                "child_count": child.child_count,
+                "is_mesh": _is_mesh_label(child.attribute_type, child.attribute_class or ""),
+            }
+            for child in root.children
+        ]
+
+    def _set_node_properties_text(self, text: str) -> None:
+        """Replace the read-only User Properties text, skipping no-ops."""
+
+        if text == self._last_properties_text:
+            return
+        self._last_properties_text = text
+        widget = self.node_properties_text
+        widget.configure(state=tk.NORMAL)
+        widget.delete("1.0", tk.END)
+        widget.insert("1.0", text)
+        widget.configure(state=tk.DISABLED)
 
     def _set_node_status(self, message: str) -> None:
         self._node_status_var.set(message)
@@ -1024,6 +1215,7 @@ class DocumentPane:
         """Flag the document so Save As knows edits were applied."""
 
         self.document.scene_graph_dirty = True
+        self.edit_generation += 1
 
     def update_document_path(self, new_path: str) -> None:
         self.document.path = str(new_path)
@@ -1054,45 +1246,169 @@ class DocumentPane:
         focus_uid: Optional[int],
         focus_node: Optional[SceneNode],
     ) -> None:
-        """Populate the tree widget from the provided ``SceneNode`` hierarchy."""
+        """Populate the tree widget from the provided ``SceneNode`` hierarchy.
+
+        Only the root and its immediate children are inserted eagerly; deeper
+        branches carry a placeholder row that ``<<TreeviewOpen>>`` swaps for
+        the real children on first expansion, so the number of Tk items scales
+        with what the user has opened instead of the whole scene.
+        """
 
+        self._parent_by_id.clear()
         self._rebuild_parent_links(scene_graph)
         self._recompute_child_counts(scene_graph)
 
         self._node_map.clear()
-        self.node_tree.delete(*self.node_tree.get_children(""))
+        self._iid_by_id.clear()
+
+        # Unmap the widget and blank its columns for the bulk insert so Tk
+        # skips per-row redisplay and column-width bookkeeping, then restore
+        # both in one pass at the end.
+        tree = self.node_tree
+        displaycolumns = tree.cget("displaycolumns")
+        tree.pack_forget()
+        tree.configure(displaycolumns=())
+        try:
+            tree.delete(*tree.get_children(""))
 
-        focus_item: Optional[str] = None
+            root_iid = self._insert_node_stub("", scene_graph)
+            self._materialize_node_children(root_iid)
+            tree.item(root_iid, open=True)
+
+            focus_item = self._reveal_node(scene_graph, root_iid, focus_uid, focus_node)
+            if focus_item:
+                tree.selection_set(focus_item)
+                tree.see(focus_item)
+            else:
+                tree.selection_set(root_iid)
+        finally:
+            tree.configure(displaycolumns=displaycolumns)
+            tree.pack(fill=tk.BOTH, expand=True, before=self._node_tree_scrollbar)
 
-        def insert(parent: str, node: SceneNode) -> None:
-            nonlocal focus_item
-            node_id = self.node_tree.insert(
-                parent,
-                tk.END,
+        self._on_node_select(None)
+
+    def _insert_node_stub(self, parent_iid: str, node: SceneNode) -> str:
+        """Insert ``node`` with a placeholder standing in for its subtree."""
+
+        iid = self.node_tree.insert(
+            parent_iid,
+            tk.END,
+            text=node.name,
+            values=(node.attribute_type, node.attribute_class, node.child_count),
+        )
+        self._node_map[iid] = node
+        self._iid_by_id[id(node)] = iid
+        if node.children:
+            self.node_tree.insert(iid, tk.END, tags=(_TREE_PLACEHOLDER_TAG,))
+        return iid
+
+    def _materialize_node_children(self, iid: str) -> None:
+        """Swap a placeholder row for the node's real children."""
+
+        children = self.node_tree.get_children(iid)
+        if not children or _TREE_PLACEHOLDER_TAG not in self.node_tree.item(children[0], "tags"):
+            return
+        self.node_tree.delete(children[0])
+        node = self._node_map.get(iid)
+        if node is None:
+            return
+        for child in node.children:
+            self._insert_node_stub(iid, child)
+
+    def _on_node_tree_open(self, _event) -> None:
+        iid = self.node_tree.focus()
+        if iid:
+            self._materialize_node_children(iid)
+
+    def _reveal_node(
+        self,
+        scene_graph: SceneNode,
+        root_iid: str,
+        focus_uid: Optional[int],
+        focus_node: Optional[SceneNode],
+    ) -> Optional[str]:
+        """Materialize the branch leading to the focus target and return its iid."""
+
+        if focus_uid is None and focus_node is None:
+            return None
+        chain = _path_to_node(scene_graph, focus_uid, focus_node)
+        if not chain:
+            return None
+        iid = root_iid
+        for ancestor in chain[1:]:
+            self._materialize_node_children(iid)
+            self.node_tree.item(iid, open=True)
+            for child_iid in self.node_tree.get_children(iid):
+                if self._node_map.get(child_iid) is ancestor:
+                    iid = child_iid
+                    break
+            else:  # pragma: no cover - defensive; chain mirrors the model
+                return None
+        return iid
+
+    # ------------------------------------------------------------------
+    # Surgical tree updates for edits
+
+    def _branch_materialized(self, iid: str) -> bool:
+        """Whether the row's children are real rows rather than a placeholder."""
+
+        children = self.node_tree.get_children(iid)
+        return not (
+            children and _TREE_PLACEHOLDER_TAG in self.node_tree.item(children[0], "tags")
+        )
+
+    def _delete_branch_rows(self, iid: str) -> None:
+        """Delete a row and its descendants, pruning the lookup maps."""
+
+        stack = [iid]
+        while stack:
+            current = stack.pop()
+            stack.extend(self.node_tree.get_children(current))
+            node = self._node_map.pop(current, None)
+            if node is not None:
+                self._iid_by_id.pop(id(node), None)
+        self.node_tree.delete(iid)
+
+    def _update_node_row(self, node: SceneNode) -> None:
+        """Refresh the node's row text and columns, if it is materialized."""
+
+        iid = self._iid_by_id.get(id(node))
+        if iid:
+            self.node_tree.item(
+                iid,
                 text=node.name,
                 values=(node.attribute_type, node.attribute_class, node.child_count),
             )
-            self._node_map[node_id] = node
-            if focus_uid is not None and node.uid == focus_uid:
-                focus_item = node_id
-            if focus_node is node:
-                focus_item = node_id
-            for child in node.children:
-                insert(node_id, child)
-
-        insert("", scene_graph)
-        root_items = self.node_tree.get_children("")
-        for child_id in root_items:
-            self.node_tree.item(child_id, open=True)
-
-        if focus_item:
-            self.node_tree.selection_set(focus_item)
-        elif root_items:
-            self.node_tree.selection_set(root_items[0])
-        else:
-            self.node_tree.selection_remove(self.node_tree.selection())
 
-        self._on_node_select(None)
+    def _move_node_rows(self, node: SceneNode, new_parent: SceneNode) -> None:
+        """Mirror a model reparent in the Treeview without a full rebuild."""
+
+        node_iid = self._iid_by_id.get(id(node))
+        parent_iid = self._iid_by_id.get(id(new_parent))
+        if parent_iid is None or not self._branch_materialized(parent_iid):
+            # The destination branch is collapsed; drop any rows for the
+            # moved subtree so expansion re-creates them in place.
+            if node_iid is not None:
+                self._delete_branch_rows(node_iid)
+            return
+        if node_iid is not None:
+            self.node_tree.move(node_iid, parent_iid, tk.END)
+        else:
+            self._insert_node_stub(parent_iid, node)
+
+    def _focus_node_row(self, node: SceneNode) -> None:
+        """Select the node's row, materializing its branch if needed."""
+
+        iid = self._iid_by_id.get(id(node))
+        if iid is None:
+            root = self.document.scene_graph
+            root_iid = self._iid_by_id.get(id(root)) if root is not None else None
+            if root is None or root_iid is None:
+                return
+            iid = self._reveal_node(root, root_iid, None, node)
+        if iid:
+            self.node_tree.selection_set(iid)
+            self.node_tree.see(iid)
 
     def _clear_scene_tree_view(self) -> None:
         """Reset the tree widget when the scene graph becomes empty."""
@@ -1101,7 +1417,10 @@ class DocumentPane:
             return
         self.node_tree.delete(*self.node_tree.get_children(""))
         self._node_map.clear()
-        self.node_properties_var.set("<none>")
+        self._iid_by_id.clear()
+        self._parent_by_id.clear()
+        self._set_node_properties_text("<none>")
+        self._last_node_detail = {}
         for var in self.node_detail_vars.values():
             var.set("")
 
@@ -1123,6 +1442,10 @@ class FBXAnalyzerApp:
 
         self.status_var = tk.StringVar(value="Load FBX files to analyze.")
         self._debug_mode = tk.BooleanVar(value=False)
+        # Worker pool for FBX parsing and saving, created on first use.
+        # Processes rather than threads: the FBX SDK is not thread-safe, the
+        # same reason the batch round-trip checker uses a process pool.
+        self._executor: Optional[ProcessPoolExecutor] = None
 
         self._build_ui()
 
@@ -1153,6 +1476,14 @@ class FBXAnalyzerApp:
         self.notebook = ttk.Notebook(self.root)
         self.notebook.pack(fill=tk.BOTH, expand=True)
 
+    def _ensure_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # Workers spawn on demand, so a single-file import only ever
+            # starts one process; multi-file imports scale up to the cap.
+            workers = max(1, min(os.cpu_count() or 1, _MAX_IMPORT_WORKERS))
+            self._executor = ProcessPoolExecutor(max_workers=workers)
+        return self._executor
+
     def _on_import_clicked(self) -> None:
         paths = filedialog.askopenfilenames(
             parent=self.root,
@@ -1162,12 +1493,53 @@ class FBXAnalyzerApp:
         if not paths:
             return
 
+        executor = self._ensure_executor()
         for path in paths:
-            document = self._analyze_file(path)
-            if document is None:
-                continue
-            self.documents.append(document)
-            self._add_document_tab(document)
+            placeholder = self._add_loading_tab(path)
+            future = executor.submit(_analyze_file_task, str(path))
+            future.add_done_callback(
+                lambda fut, frame=placeholder: self.root.after(
+                    0, self._on_analysis_done, fut, frame
+                )
+            )
+
+    def _add_loading_tab(self, path: str) -> ttk.Frame:
+        """Show an immediate placeholder tab while the file parses off-thread."""
+
+        frame = ttk.Frame(self.notebook)
+        ttk.Label(
+            frame,
+            text=f"Loading {Path(path).name or path}…",
+            padding=40,
+        ).pack(fill=tk.BOTH, expand=True)
+        self.notebook.add(frame, text=Path(path).name or path)
+        self.notebook.select(frame)
+        return frame
+
+    def _on_analysis_done(self, future, placeholder: ttk.Frame) -> None:
+        """Swap a placeholder tab for the analyzed document (Tk thread only)."""
+
+        index = self.notebook.index(placeholder)
+        was_selected = self.notebook.select() == str(placeholder)
+        try:
+            document = future.result()
+        except Exception as exc:
+            self.notebook.forget(placeholder)
+            placeholder.destroy()
+            self._update_status()
+            messagebox.showerror("FBX Analyzer", str(exc), parent=self.root)
+            return
+
+        self.documents.append(document)
+        pane = DocumentPane(self.notebook, document)
+        tab_text = Path(document.path).name or document.path
+        self.notebook.insert(index, pane.frame, text=tab_text)
+        self.notebook.forget(placeholder)
+        placeholder.destroy()
+        self.document_tabs[str(pane.frame)] = pane
+        if was_selected:
+            self.notebook.select(pane.frame)
+        self._update_status()
 
     def _on_close_clicked(self) -> None:
         tab_id = self.notebook.select()
@@ -1212,26 +1584,46 @@ class FBXAnalyzerApp:
         if not save_path:
             return
 
-        debug_log_path: Optional[Path] = None
+        debug = self._debug_mode.get()
+        if debug:
+            scene_graph = pane.document.scene_graph
+        else:
+            # Edits come straight from the viewer; skip the reload-and-
+            # revalidate pass, which would double the save time.
+            scene_graph = pane.document.scene_graph if pane.document.scene_graph_dirty else None
+
+        self.status_var.set(f"Saving to {save_path}…")
+        generation = pane.edit_generation
+        future = self._ensure_executor().submit(
+            _save_scene_task, pane.document.path, save_path, scene_graph, debug
+        )
+        future.add_done_callback(
+            lambda fut, p=pane, sp=save_path, dbg=debug, gen=generation: self.root.after(
+                0, self._on_save_done, fut, p, sp, dbg, gen
+            )
+        )
+
+    def _on_save_done(
+        self, future, pane: DocumentPane, save_path: str, debug: bool, generation: int
+    ) -> None:
+        """Apply the result of an off-thread save (Tk thread only)."""
+
         try:
-            if self._debug_mode.get():
-                diagnostics = rebuild_scene_graph_as(
-                    pane.document.path,
-                    save_path,
-                    pane.document.scene_graph,
-                    diagnostics=SceneExportDiagnostics(),
-                )
-                debug_log_path = self._write_debug_diagnostics(Path(save_path), diagnostics)
-            else:
-                scene_graph = pane.document.scene_graph if pane.document.scene_graph_dirty else None
-                save_scene_graph_as(pane.document.path, save_path, scene_graph)
-        except (FBXSDKNotAvailableError, FBXLoadError, FBXSaveError) as exc:
+            diagnostics = future.result()
+        except Exception as exc:
+            self._update_status()
             messagebox.showerror("FBX Analyzer", str(exc), parent=self.root)
             return
 
-        pane.document.scene_graph_dirty = False
+        if pane.edit_generation == generation:
+            # Only clear the flag if nothing was edited while the worker ran;
+            # otherwise those edits would be dropped by the next Save As.
+            pane.document.scene_graph_dirty = False
         pane.update_document_path(save_path)
-        if self._debug_mode.get():
+        if debug:
+            debug_log_path: Optional[Path] = None
+            if diagnostics is not None:
+                debug_log_path = self._write_debug_diagnostics(Path(save_path), diagnostics)
             if debug_log_path is not None:
                 self.status_var.set(
                     f"Saved debug copy to {save_path}; diagnostics -> {debug_log_path}"
@@ -1249,44 +1641,13 @@ class FBXAnalyzerApp:
         debug_path = save_path.with_suffix(save_path.suffix + ".debug.json")
         try:
             debug_path.write_text(
-                json.dumps(asdict(diagnostics), indent=2),
+                json.dumps(diagnostics.to_dict(), indent=2),
                 encoding="utf-8",
             )
             return debug_path
         except Exception:
             return None
 
-    def _analyze_file(self, path: str) -> Optional[AnalyzedScene]:
-        skeleton_inspector = SkeletonInspector()
-        top_level_inspector = TopLevelInspector()
-        scene_graph_inspector = SceneGraphInspector()
-        metadata_inspector = SceneMetadataInspector()
-
-        try:
-            with FBXAnalyzer(str(path)) as analyzer:
-                results = analyzer.run([
-                    skeleton_inspector,
-                    top_level_inspector,
-                    scene_graph_inspector,
-                    metadata_inspector,
-                ])
-        except (FBXSDKNotAvailableError, FBXLoadError) as exc:
-            messagebox.showerror("FBX Analyzer", str(exc), parent=self.root)
-            return None
-
-        skeletons = results.get(skeleton_inspector.id, [])
-        top_level_nodes = results.get(top_level_inspector.id, []) or []
-        scene_graph = results.get(scene_graph_inspector.id)
-        metadata = results.get(metadata_inspector.id) or SceneMetadata()
-
-        return AnalyzedScene(
-            path=str(path),
-            skeletons=skeletons,
-            scene_graph=scene_graph,
-            top_level_nodes=top_level_nodes,
-            metadata=metadata,
-        )
-
     def _add_document_tab(self, document: AnalyzedScene) -> None:
         pane = DocumentPane(self.notebook, document)
         tab_text = Path(document.path).name or document.path
@@ -1307,7 +1668,11 @@ class FBXAnalyzerApp:
     def run(self) -> None:
         if not self.documents:
             self.status_var.set("No FBX files loaded. Use 'Import FBX...' to begin.")
-        self.root.mainloop()
+        try:
+            self.root.mainloop()
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
 
 
 def launch_skeleton_viewer(documents: List[AnalyzedScene]) -> None:
@@ -1315,8 +1680,103 @@ def launch_skeleton_viewer(documents: List[AnalyzedScene]) -> None:
     app.run()
 
 
+def _analyze_file_task(path: str) -> AnalyzedScene:
+    """Run the full inspector suite for ``path``.
+
+    Executes in a worker process, so it must stay module-level (picklable)
+    and must not touch Tk; errors propagate to the GUI via the future.
+    """
+
+    skeleton_inspector = SkeletonInspector()
+    top_level_inspector = TopLevelInspector()
+    scene_graph_inspector = SceneGraphInspector()
+    metadata_inspector = SceneMetadataInspector()
+
+    with FBXAnalyzer(str(path)) as analyzer:
+        results = analyzer.run([
+            skeleton_inspector,
+            top_level_inspector,
+            scene_graph_inspector,
+            metadata_inspector,
+        ])
+
+    return AnalyzedScene(
+        path=str(path),
+        skeletons=results.get(skeleton_inspector.id, []),
+        scene_graph=results.get(scene_graph_inspector.id),
+        top_level_nodes=results.get(top_level_inspector.id, []) or [],
+        metadata=results.get(metadata_inspector.id) or SceneMetadata(),
+    )
+
+
+def _save_scene_task(
+    source_path: str,
+    save_path: str,
+    scene_graph: Optional[SceneNode],
+    debug: bool,
+) -> Optional[SceneExportDiagnostics]:
+    """Save ``source_path`` as ``save_path`` in a worker process."""
+
+    if debug:
+        return rebuild_scene_graph_as(
+            source_path, save_path, scene_graph, diagnostics=SceneExportDiagnostics()
+        )
+    save_scene_graph_as(source_path, save_path, scene_graph, verify_roundtrip=False)
+    return None
+
+
 def _vector_to_string(vector: Iterable[float]) -> str:
-    return ", ".join(f"{component:.3f}" for component in vector)
+    # Transforms are 3-vectors throughout; one fused %-format beats the
+    # per-component f-string and join on this per-selection path.
+    components = vector if isinstance(vector, tuple) else tuple(vector)
+    if len(components) == 3:
+        return "%.3f, %.3f, %.3f" % components
+    return ", ".join("%.3f" % component for component in components)
+
+
+def _remove_child(parent: SceneNode, node: SceneNode) -> None:
+    """Detach ``node`` from ``parent`` by identity.
+
+    ``list.remove`` would compare via the dataclass ``__eq__``, which
+    deep-compares entire subtrees per sibling and could even match a
+    different, structurally equal sibling; the identity scan is both
+    cheaper and exact.
+    """
+
+    children = parent.children
+    for index, child in enumerate(children):
+        if child is node:
+            del children[index]
+            return
+    raise ValueError(f"{node.name} is not a child of {parent.name}")
+
+
+@functools.lru_cache(maxsize=None)
+def _is_mesh_label(attribute_type: str, attribute_class: str) -> bool:
+    """Classify a node as a mesh from its attribute labels.
+
+    Scenes repeat the same handful of label pairs, so the lowercasing is
+    memoized rather than redone per child on every edit.
+    """
+
+    return "mesh" in attribute_type.lower() or attribute_class.lower().endswith("mesh")
+
+
+def _path_to_node(
+    root: SceneNode,
+    focus_uid: Optional[int],
+    focus_node: Optional[SceneNode],
+) -> Optional[List[SceneNode]]:
+    """Return the root-to-target ancestor chain for the focus target, if any."""
+
+    stack: List[Tuple[SceneNode, Tuple[SceneNode, ...]]] = [(root, (root,))]
+    while stack:
+        node, chain = stack.pop()
+        if node is focus_node or (focus_uid is not None and node.uid == focus_uid):
+            return list(chain)
+        for child in node.children:
+            stack.append((child, chain + (child,)))
+    return None
 
 
 
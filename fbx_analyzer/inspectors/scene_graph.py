@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Dict, Tuple
+from typing import Any, Dict, Optional
 
 from ..core import sdk
 from ..core.analyzer import SceneContext, SceneInspector
@@ -11,40 +11,62 @@ from ..utils import double3_to_tuple
 
 
 class SceneGraphInspector(SceneInspector):
-    """Capture the entire scene hierarchy as editable ``SceneNode`` models."""
+    """Capture the entire scene hierarchy as editable ``SceneNode`` models.
+
+    Implements the fused-traversal protocol: each node arrives exactly once
+    in depth-first order, so parents are always materialised before their
+    children and the tree can be stitched together by unique ID.
+    """
 
     id = "scene_graph"
 
-    def collect(self, context: SceneContext) -> SceneNode:
+    def begin(self, context: SceneContext) -> None:
         fbx, _ = sdk.import_fbx_module()
+        self._fbx = fbx
+        self._root: Optional[SceneNode] = None
+        self._by_uid: Dict[int, SceneNode] = {}
+
+    def visit(self, node: Any, attr: Any, attr_type: Any) -> None:
+        parent = node.GetParent()
+        parent_uid = parent.GetUniqueID() if parent else None
+        parent_node = (
+            self._by_uid.get(parent_uid) if parent_uid is not None else None
+        )
+        path = (
+            parent_node.original_path + (len(parent_node.children),)
+            if parent_node is not None
+            else ()
+        )
+
+        scene_node = SceneNode(
+            name=node.GetName() or f"Node_{node.GetUniqueID()}",
+            attribute_type=attr.GetTypeName() if attr else "None",
+            attribute_class=attr.__class__.__name__ if attr else "(NoAttribute)",
+            translation=double3_to_tuple(node.LclTranslation.Get()),
+            rotation=double3_to_tuple(node.LclRotation.Get()),
+            scaling=double3_to_tuple(node.LclScaling.Get()),
+            child_count=node.GetChildCount(),
+            uid=node.GetUniqueID(),
+            parent_uid=parent_uid,
+            original_path=path,
+            properties=_collect_user_properties(node, self._fbx),
+        )
+
+        self._by_uid[scene_node.uid] = scene_node
+        if parent_node is not None:
+            parent_node.children.append(scene_node)
+        else:
+            self._root = scene_node
 
-        def build(node, path: Tuple[int, ...]) -> SceneNode:  # type: ignore[valid-type]
-            attribute = node.GetNodeAttribute()
-            attribute_type = attribute.GetTypeName() if attribute else "None"
-            attribute_class = attribute.__class__.__name__ if attribute else "(NoAttribute)"
-
-            scene_node = SceneNode(
-                name=node.GetName() or f"Node_{node.GetUniqueID()}",
-                attribute_type=attribute_type,
-                attribute_class=attribute_class,
-                translation=double3_to_tuple(node.LclTranslation.Get()),
-                rotation=double3_to_tuple(node.LclRotation.Get()),
-                scaling=double3_to_tuple(node.LclScaling.Get()),
-                child_count=node.GetChildCount(),
-                uid=node.GetUniqueID(),
-                parent_uid=node.GetParent().GetUniqueID() if node.GetParent() else None,
-                original_path=path,
-                properties=_collect_user_properties(node, fbx),
-            )
-
-            for idx in range(node.GetChildCount()):
-                child_path = path + (idx,)
-                scene_node.children.append(build(node.GetChild(idx), child_path))
-
-            scene_node.child_count = len(scene_node.children)
-            return scene_node
-
-        return build(context.root_node, ())
+    def finalize(self) -> Optional[SceneNode]:
+        root = self._root
+        self._root = None
+        self._by_uid = {}
+        if root is not None:
+            # Remember the load-time structure so the save path can detect
+            # transforms-only edits and skip structural reconciliation.
+            root.loaded_signature = root.structure_signature()
+        return root
 
 
 def _collect_user_properties(node, fbx_module) -> Dict[str, str]:  # type: ignore[valid-type]
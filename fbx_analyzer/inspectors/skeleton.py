@@ -88,7 +88,7 @@ def _collect_explicit_skeletons(
         return joint
 
     skeleton_roots: List[Skeleton] = []
-    for node in traversal.iter_nodes(context.root_node):
+    for node in traversal.iter_nodes(context.root_node, stack=context.node_stack):
         if not is_skeleton_node(node):
             continue
 
@@ -104,12 +104,12 @@ def _collect_explicit_skeletons(
 
 def _collect_animation_bound_skeletons(context: SceneContext, fbx_module) -> List[Skeleton]:
     layers = _collect_anim_layers(context.scene, fbx_module)
-    cluster_uids = _collect_cluster_link_nodes(context.root_node, fbx_module)
+    cluster_uids = _collect_cluster_link_nodes(context.root_node, fbx_module, stack=context.node_stack)
 
     node_lookup: Dict[int, Any] = {}
     animated_uids: Set[int] = set()
 
-    for node in traversal.iter_nodes(context.root_node):
+    for node in traversal.iter_nodes(context.root_node, stack=context.node_stack):
         uid = node.GetUniqueID()
         node_lookup[uid] = node
         if layers and _node_has_animation(node, layers):
@@ -231,14 +231,14 @@ def _node_has_animation(node, layers: Iterable[Any]) -> bool:
     return False
 
 
-def _collect_cluster_link_nodes(root_node, fbx_module) -> Set[int]:
+def _collect_cluster_link_nodes(root_node, fbx_module, stack=None) -> Set[int]:
     cluster_uids: Set[int] = set()
 
     mesh_class_id = getattr(fbx_module.FbxMesh, "ClassId", None)
     mesh_attribute_type = getattr(fbx_module.FbxNodeAttribute, "eMesh", None)
     skin_enum = getattr(fbx_module.FbxDeformer, "eSkin", None)
 
-    for node in traversal.iter_nodes(root_node):
+    for node in traversal.iter_nodes(root_node, stack=stack):
         attribute = node.GetNodeAttribute()
         if attribute is None:
             continue
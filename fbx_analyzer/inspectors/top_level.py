@@ -9,30 +9,39 @@ from ..core.analyzer import SceneContext, SceneInspector
 
 
 class TopLevelInspector(SceneInspector):
+    """Summarise the immediate children of the scene root.
+
+    Implements the fused-traversal protocol so it shares a single scene walk
+    with the other per-node inspectors instead of iterating the root's
+    children on its own.
+    """
+
     id = "top_level_nodes"
 
-    def collect(self, context: SceneContext) -> List[Dict[str, Any]]:
+    def begin(self, context: SceneContext) -> None:
         fbx, _ = sdk.import_fbx_module()
-        root = context.root_node
-        summary: List[Dict[str, Any]] = []
-
-        mesh_enum = getattr(fbx.FbxNodeAttribute, "eMesh", None)
-
-        for idx in range(root.GetChildCount()):
-            node = root.GetChild(idx)
-            attribute = node.GetNodeAttribute()
-            attr_type = attribute.GetTypeName() if attribute else "None"
-            attr_class = attribute.__class__.__name__ if attribute else "(NoAttribute)"
-            attr_enum = attribute.GetAttributeType() if hasattr(attribute, "GetAttributeType") else None
-
-            summary.append(
-                {
-                    "name": node.GetName() or f"Node_{node.GetUniqueID()}",
-                    "attribute_type": attr_type,
-                    "attribute_class": attr_class,
-                    "child_count": node.GetChildCount(),
-                    "is_mesh": bool(mesh_enum is not None and attr_enum == mesh_enum),
-                }
-            )
-
+        self._mesh_enum = getattr(fbx.FbxNodeAttribute, "eMesh", None)
+        self._root_uid = context.root_node.GetUniqueID()
+        self._summary: List[Dict[str, Any]] = []
+
+    def visit(self, node: Any, attr: Any, attr_type: Any) -> None:
+        parent = node.GetParent()
+        if parent is None or parent.GetUniqueID() != self._root_uid:
+            return
+
+        self._summary.append(
+            {
+                "name": node.GetName() or f"Node_{node.GetUniqueID()}",
+                "attribute_type": attr.GetTypeName() if attr else "None",
+                "attribute_class": attr.__class__.__name__ if attr else "(NoAttribute)",
+                "child_count": node.GetChildCount(),
+                "is_mesh": bool(
+                    self._mesh_enum is not None and attr_type == self._mesh_enum
+                ),
+            }
+        )
+
+    def finalize(self) -> List[Dict[str, Any]]:
+        summary = self._summary
+        self._summary = []
         return summary
@@ -25,9 +25,43 @@ class Joint:
     properties: Dict[str, str] = field(default_factory=dict)
 
     def walk(self):
-        yield self
-        for child in self.children:
-            yield from child.walk()
+        """Yield this joint and all descendants depth-first, preorder."""
+
+        stack = [self]
+        pop = stack.pop
+        while stack:
+            node = pop()
+            yield node
+            if node.children:
+                stack.extend(reversed(node.children))
+
+    def __reduce__(self):
+        """Pickle as a flat preorder row list.
+
+        The default dataclass reduction nests one pickle frame per tree
+        level, so hierarchies deep enough for :meth:`walk` to handle still
+        overflow the interpreter stack in ``pickle`` and ``copy.deepcopy``.
+        Each row carries its parent's index instead of nested children.
+        """
+
+        rows = []
+        stack = [(self, -1)]
+        pop = stack.pop
+        while stack:
+            node, parent_index = pop()
+            index = len(rows)
+            rows.append(
+                (
+                    parent_index,
+                    node.name,
+                    node.joint_type,
+                    node.transform,
+                    node.parent_name,
+                    node.properties,
+                )
+            )
+            stack.extend((child, index) for child in reversed(node.children))
+        return (_joint_from_rows, (rows,))
 
 
 @dataclass
@@ -54,11 +88,124 @@ class SceneNode:
     original_path: Tuple[int, ...] = ()
     properties: Dict[str, str] = field(default_factory=dict)
     children: List['SceneNode'] = field(default_factory=list)
+    loaded_signature: Optional[int] = None
 
     def walk(self):
-        yield self
-        for child in self.children:
-            yield from child.walk()
+        """Yield this node and all descendants depth-first, preorder."""
+
+        stack = [self]
+        pop = stack.pop
+        while stack:
+            node = pop()
+            yield node
+            if node.children:
+                stack.extend(reversed(node.children))
+
+    def structure_signature(self) -> int:
+        """Hash of the tree's structure and attribute types.
+
+        Per node this covers (uid, attribute_type, child uids); transform
+        edits do not change it, so the save path can detect "transforms only"
+        edits and skip the structural reconciliation work. The inspector
+        stashes the load-time value in ``loaded_signature`` on the root.
+        """
+
+        parts = []
+        stack = [self]
+        pop = stack.pop
+        while stack:
+            node = pop()
+            parts.append(
+                (node.uid, node.attribute_type, tuple(child.uid for child in node.children))
+            )
+            stack.extend(node.children)
+        return hash(tuple(parts))
+
+    def __reduce__(self):
+        """Pickle as a flat preorder row list; see :meth:`Joint.__reduce__`."""
+
+        rows = []
+        stack = [(self, -1)]
+        pop = stack.pop
+        while stack:
+            node, parent_index = pop()
+            index = len(rows)
+            rows.append(
+                (
+                    parent_index,
+                    node.name,
+                    node.attribute_type,
+                    node.attribute_class,
+                    node.translation,
+                    node.rotation,
+                    node.scaling,
+                    node.child_count,
+                    node.uid,
+                    node.parent_uid,
+                    node.original_path,
+                    node.properties,
+                    node.loaded_signature,
+                )
+            )
+            stack.extend((child, index) for child in reversed(node.children))
+        return (_scene_node_from_rows, (rows,))
+
+
+def _joint_from_rows(rows) -> Joint:
+    """Rebuild a ``Joint`` tree from its flat preorder encoding."""
+
+    joints: List[Joint] = []
+    for parent_index, name, joint_type, transform, parent_name, properties in rows:
+        joint = Joint(
+            name=name,
+            joint_type=joint_type,
+            transform=transform,
+            parent_name=parent_name,
+            properties=properties,
+        )
+        joints.append(joint)
+        if parent_index >= 0:
+            joints[parent_index].children.append(joint)
+    return joints[0]
+
+
+def _scene_node_from_rows(rows) -> "SceneNode":
+    """Rebuild a ``SceneNode`` tree from its flat preorder encoding."""
+
+    nodes: List[SceneNode] = []
+    for (
+        parent_index,
+        name,
+        attribute_type,
+        attribute_class,
+        translation,
+        rotation,
+        scaling,
+        child_count,
+        uid,
+        parent_uid,
+        original_path,
+        properties,
+        loaded_signature,
+    ) in rows:
+        node = SceneNode(
+            name=name,
+            attribute_type=attribute_type,
+            attribute_class=attribute_class,
+            translation=translation,
+            rotation=rotation,
+            scaling=scaling,
+            child_count=child_count,
+            uid=uid,
+            parent_uid=parent_uid,
+            original_path=original_path,
+            properties=properties,
+            loaded_signature=loaded_signature,
+        )
+        nodes.append(node)
+        if parent_index >= 0:
+            nodes[parent_index].children.append(node)
+    return nodes[0]
 
 
 @dataclass
@@ -2,12 +2,32 @@
 
 from __future__ import annotations
 
-from typing import Any, Iterable, Tuple, TypeVar
+import functools
+from typing import Any, Dict, Iterable, Tuple, TypeVar
 
 Vector3 = Tuple[float, float, float]
 T = TypeVar("T")
 
 
+@functools.lru_cache(maxsize=None)
+def _enum_index(enum_holder: Any) -> Dict[str, Any]:
+    """Build a case-insensitive name->value index for ``enum_holder``.
+
+    The dir() scan and string lowering run once per holder; subsequent
+    lookups are a dict probe.
+    """
+
+    index: Dict[str, Any] = {}
+    for attr_name in dir(enum_holder):
+        if attr_name.startswith("_"):
+            continue
+        try:
+            index[attr_name.lower()] = getattr(enum_holder, attr_name)
+        except AttributeError:  # pragma: no cover - defensive for SWIG proxies
+            continue
+    return index
+
+
 def resolve_enum_value(enum_holder: Any, target_name: str) -> Any:
     """Return an enum value by name, handling SDK layout differences.
 
@@ -21,15 +41,16 @@ def resolve_enum_value(enum_holder: Any, target_name: str) -> Any:
     if hasattr(enum_holder, target_name):
         return getattr(enum_holder, target_name)
 
-    for attr_name in dir(enum_holder):
-        if attr_name.lower() == target_name.lower():
-            return getattr(enum_holder, attr_name)
+    lowered = target_name.lower()
+    index = _enum_index(enum_holder)
+    if lowered in index:
+        return index[lowered]
 
     nested = getattr(enum_holder, "EType", None)
     if nested is not None:
-        for attr_name in dir(nested):
-            if attr_name.lower() == target_name.lower():
-                return getattr(nested, attr_name)
+        nested_index = _enum_index(nested)
+        if lowered in nested_index:
+            return nested_index[lowered]
 
     raise AttributeError(
         f"Unable to resolve enum value '{target_name}' from {enum_holder!r}"